@@ -1,16 +1,13 @@
 #!/usr/bin/env python3
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
+if TYPE_CHECKING:
+    from service.llm_client import LLMClient
 
-from service.llm_client import LLMClient
-from core import planner, executor, tools
-from models import Plan
-
-
-console = Console()
+# Heavier imports (rich, pydantic, requests) are deferred into main() so
+# `-h` and plain `ask` don't pay for modules they never use.
 
 
 def parse_args() -> argparse.Namespace:
@@ -29,6 +26,11 @@ def parse_args() -> argparse.Namespace:
     ask_parser.add_argument(
         "query", nargs="+", help="Question or prompt for the agent."
     )
+    ask_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the model instead of reusing a cached answer.",
+    )
 
     # Action / control mode
     do_parser = subparsers.add_parser(
@@ -41,6 +43,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Show planned actions but do not execute.",
     )
+    do_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the model instead of reusing a cached plan or summary.",
+    )
 
     return parser.parse_args()
 
@@ -49,13 +56,41 @@ def main() -> None:
     args = parse_args()
     query = " ".join(args.query)
 
-    llm = LLMClient()
+    from service.llm_cache import LLMCache
+    from service.llm_client import LLMClient, ModelNotFoundError
+
+    llm = LLMClient(cache=None if args.no_cache else LLMCache())
+
+    try:
+        run(args, query, llm)
+    except ModelNotFoundError as e:
+        from rich.panel import Panel
+
+        from core.ui import console
+
+        console.print(
+            Panel(str(e), title="⚠️  Model Not Found", border_style="red"),
+            style="bold red",
+        )
+        sys.exit(1)
+
 
+def run(args: argparse.Namespace, query: str, llm: "LLMClient") -> None:
     if args.command == "ask":
         answer = llm.chat(query, mode="chat")
+        if not sys.stdout.isatty():
+            # Piped or redirected: plain text, and no need to load rich at all
+            print(answer)
+            return
+
+        from rich.panel import Panel
+        from rich.text import Text
+
+        from core.ui import console
+
         console.print(
             Panel(
-                answer,
+                Text(answer),
                 title="🤖 Answer",
                 border_style="cyan",
             )
@@ -63,13 +98,24 @@ def main() -> None:
         return
 
     if args.command == "do":
-        tool_specs = tools.get_tool_specs()
+        from rich.panel import Panel
 
-        plan: Plan | None = planner.get_action_plan(
-            llm=llm,
-            user_query=query,
-            tools=tool_specs,
-        )
+        from core import executor, fast_router
+        from core.ui import console
+        from models import Plan
+
+        # Trivial requests ("list downloads", "read notes.md") map straight
+        # to a plan; only the rest pay for an LLM round-trip.
+        plan: Plan | None = fast_router.try_route(query)
+
+        if plan is None:
+            from core import planner, tools
+
+            plan = planner.get_action_plan(
+                llm=llm,
+                user_query=query,
+                tools=tools.get_tool_specs(),
+            )
 
         if plan is None:
             console.print(
@@ -86,10 +132,10 @@ def main() -> None:
             executor.show_plan(plan, dry_run=True)
             return
 
-        executor.execute_plan(plan)
+        executor.execute_plan(plan, llm=llm)
 
     else:
-        console.print("[bold red]Unknown command.[/bold red]")
+        print("Unknown command.", file=sys.stderr)
         sys.exit(1)
 
 
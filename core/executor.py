@@ -1,16 +1,50 @@
+import codecs
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.live import Live
+from rich.pretty import Pretty
 from rich.prompt import Confirm
+from rich.text import Text
 
 from models import Plan, Action
+from service.llm_client import LLMClient
 from . import tools as tool_mod
-
-
-console = Console()
+from .planner import _extract_json
+from .tools import _normalize_path
+from .ui import console
+
+# Tools that only inspect the system. Consecutive runs of these are fetched
+# concurrently; everything else runs one at a time, in plan order.
+READ_ONLY = frozenset(
+    {
+        "read_file",
+        "get_file_info",
+        "list_directory",
+        "search_content",
+        "find_item",
+        "compare_files",
+    }
+)
+MAX_PARALLEL_READS = 8
+
+# Several summarize_file actions in one plan share a single LLM request,
+# bounded so the combined prompt stays within a small model's context
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_BATCH_CHARS = 12_000
+MAX_PARALLEL_SUMMARIES = 4
+
+# Lines of output shown while a long-running shell command is streaming
+LIVE_SHELL_LINES = 20
+
+# How much of an existing file write_file reads for its "before" preview
+PREVIEW_READ_BYTES = 64 * 1024
 
 DANGEROUS_SUBSTRINGS = [
     "rm -rf /",
@@ -19,12 +53,15 @@ DANGEROUS_SUBSTRINGS = [
 ]
 
 
+# All blocked patterns folded into one case-insensitive alternation, so a
+# command is checked in a single scan however long the blocklist gets
+_DANGER_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in DANGEROUS_SUBSTRINGS), re.IGNORECASE
+)
+
+
 def _is_command_safe(command: str) -> bool:
-    cmd_lower = command.lower()
-    for pattern in DANGEROUS_SUBSTRINGS:
-        if pattern in cmd_lower:
-            return False
-    return True
+    return _DANGER_RE.search(command) is None
 
 
 def show_plan(plan: Plan, dry_run: bool = False) -> None:
@@ -48,7 +85,7 @@ def show_plan(plan: Plan, dry_run: bool = False) -> None:
     table.add_column("Args", overflow="fold")
 
     for i, action in enumerate(plan.actions, start=1):
-        table.add_row(str(i), action.tool, repr(action.args))
+        table.add_row(str(i), action.tool, _args_preview(action))
 
     console.print(Panel(table, title="Actions", border_style="green"))
 
@@ -58,7 +95,38 @@ def show_plan(plan: Plan, dry_run: bool = False) -> None:
         )
 
 
-def execute_plan(plan: Plan) -> None:
+# Shown in full: the command and the paths are what the user is approving
+_EXACT_ARGS = {
+    "command",
+    "path",
+    "source",
+    "destination",
+    "file1",
+    "file2",
+    "archive_path",
+    "name",
+}
+_MAX_ARG_CHARS = 120
+
+
+def _args_preview(action: Action) -> Pretty:
+    """Bounded rendering of an action's args for the plan table."""
+    args = dict(action.args)
+    if action.tool == "write_file" and "content" in args:
+        # The full body is shown in the write preview; here it's just noise
+        size = len(str(args["content"]).encode("utf-8"))
+        args["content"] = f"<{size} bytes>"
+    # Only other long free-text values get shortened
+    for key, value in args.items():
+        if key in _EXACT_ARGS or not isinstance(value, str):
+            continue
+        if len(value) > _MAX_ARG_CHARS:
+            extra = len(value) - _MAX_ARG_CHARS
+            args[key] = f"{value[:_MAX_ARG_CHARS]}... (+{extra} chars)"
+    return Pretty(args, overflow="fold")
+
+
+def execute_plan(plan: Plan, llm: LLMClient | None = None) -> None:
     show_plan(plan, dry_run=False)
 
     console.print()
@@ -74,50 +142,88 @@ def execute_plan(plan: Plan) -> None:
         console.print("[bold yellow]Nothing to do.[/bold yellow]")
         return
 
-    for i, action in enumerate(plan.actions, start=1):
-        console.print()
-        console.rule(f"➡️  Action {i}: [bold]{action.tool}[/bold]")
-
-        if action.tool == "run_shell":
-            _exec_run_shell(action)
-
-        elif action.tool == "read_file":
-            _exec_read_file(action)
-
-        elif action.tool == "write_file":
-            _exec_write_file(action)
-
-        elif action.tool == "find_item":
-            _exec_find_item(action)
-
-        elif action.tool == "summarize_file":
-            _exec_summarize_file(action)
-
-        elif action.tool == "list_directory":
-            _exec_list_directory(action)
-
-        elif action.tool == "search_content":
-            _exec_search_content(action)
-
-        elif action.tool == "get_file_info":
-            _exec_get_file_info(action)
-
-        elif action.tool == "copy_file":
-            _exec_copy_file(action)
+    if llm is None:
+        llm = LLMClient()
 
-        elif action.tool == "move_file":
-            _exec_move_file(action)
+    prefetched: dict[int, Future] = {}
+    summaries: dict[int, _PreparedSummary] = {}
+    # Read-only results seen since the last state-changing action, so a
+    # repeated lookup in the same plan is shown again instead of redone
+    seen: dict[tuple, tuple[int, Future]] = {}
 
-        elif action.tool == "compare_files":
-            _exec_compare_files(action)
+    for i, action in enumerate(plan.actions, start=1):
+        if action.tool in READ_ONLY and i not in prefetched:
+            prefetched.update(_prefetch_read_only_run(plan.actions, i))
+        if action.tool == "summarize_file" and i not in summaries:
+            summaries.update(_prepare_summaries(plan.actions, i, llm))
+        fetched = prefetched.pop(i, None)
 
-        elif action.tool == "extract_archive":
-            _exec_extract_archive(action)
+        console.print()
+        console.rule(f"➡️  Action {i}: [bold]{action.tool}[/bold]")
 
-        else:
+        handler = _DISPATCH.get(action.tool)
+        if handler is None:
             console.print(
                 f"[yellow]⚠️ Unknown tool:[/yellow] {action.tool!r}, skipping."
             )
+            continue
+
+        if action.tool in READ_ONLY:
+            key = _action_key(action)
+            if key in seen:
+                first, earlier = seen[key]
+                result = earlier.result()
+                if result is not None:
+                    console.print(f"[dim](cached from action #{first})[/dim]")
+                    _print_result(result)
+                    continue
+            if fetched is None:
+                fetched = Future()
+                fetched.set_result(_FETCHERS[action.tool](action))
+            seen.setdefault(key, (i, fetched))
+            handler(action, fetched)
+        elif action.tool == "summarize_file":
+            handler(action, llm, summaries.pop(i, None))
+        else:
+            # Anything else may have changed what a repeated read would see
+            seen.clear()
+            handler(action)
+
+
+def _action_key(action: Action) -> tuple:
+    return (action.tool, tuple(sorted((k, repr(v)) for k, v in action.args.items())))
+
+
+def _prefetch_read_only_run(actions: list[Action], start: int) -> dict[int, Future]:
+    """
+    Start the tool calls for the run of consecutive read-only actions
+    beginning at 1-based index `start` on a thread pool.
+
+    Only the (I/O bound) tool calls run concurrently. Rendering and any
+    follow-up prompts still happen on the main thread in plan order, so
+    output never interleaves. Runs of a single action are left alone.
+    """
+    run: list[tuple[int, Action]] = []
+    for i, action in enumerate(actions[start - 1 :], start=start):
+        if action.tool not in READ_ONLY:
+            break
+        run.append((i, action))
+
+    if len(run) < 2:
+        return {}
+
+    pool = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_READS, len(run)))
+    futures: dict[int, Future] = {}
+    by_key: dict[tuple, Future] = {}
+    for i, action in run:
+        # Identical actions in the run share one call
+        key = _action_key(action)
+        if key not in by_key:
+            by_key[key] = pool.submit(_FETCHERS[action.tool], action)
+        futures[i] = by_key[key]
+    # Let the workers finish on their own; results are collected as we go
+    pool.shutdown(wait=False)
+    return futures
 
 
 def _exec_run_shell(action: Action) -> None:
@@ -130,17 +236,52 @@ def _exec_run_shell(action: Action) -> None:
             f"[bold red]Blocked dangerous command:[/bold red] [italic]{command!r}[/italic]"
         )
         return
-    result = tool_mod.run_shell(command)
+
+    live: Live | None = None
+
+    def _show_progress(stdout_lines: list[str], stderr_lines: list[str]) -> None:
+        nonlocal live
+        panels = [
+            Panel(
+                Text("".join(stdout_lines[-LIVE_SHELL_LINES:]).rstrip()),
+                title="stdout (running...)",
+                border_style="cyan",
+            )
+        ]
+        if stderr_lines:
+            panels.append(
+                Panel(
+                    Text("".join(stderr_lines[-LIVE_SHELL_LINES:]).rstrip()),
+                    title="stderr",
+                    border_style="yellow",
+                )
+            )
+        if live is None:
+            live = Live(console=console, refresh_per_second=10, transient=True)
+            live.start()
+        live.update(Group(*panels))
+
+    try:
+        result = tool_mod.stream_shell(command, on_progress=_show_progress)
+    finally:
+        if live is not None:
+            live.stop()
     _print_result(result)
 
 
-def _exec_read_file(action: Action) -> None:
+def _fetch_read_file(action: Action) -> dict[str, Any] | None:
     path = str(action.args.get("path", ""))
     max_bytes = int(action.args.get("max_bytes", 5000))
     if not path:
+        return None
+    return tool_mod.read_file(path, max_bytes=max_bytes)
+
+
+def _exec_read_file(action: Action, fetched: Future | None = None) -> None:
+    result = fetched.result() if fetched else _fetch_read_file(action)
+    if result is None:
         console.print("[yellow]Missing 'path' argument. Skipping.[/yellow]")
         return
-    result = tool_mod.read_file(path, max_bytes=max_bytes)
     _print_result(result)
 
 
@@ -156,51 +297,59 @@ def _exec_write_file(action: Action) -> None:
         return
 
     # Use the tool's path normalization to handle common folders
-    from core.tools import _normalize_path
-
     p = _normalize_path(path)
 
     before_text = ""
+    before_truncated = False
     before_exists = p.exists()
     if before_exists:
+        # Only the head is shown, so never read more than the preview needs
         try:
-            before_text = p.read_text(encoding="utf-8")
+            with p.open("rb") as f:
+                raw = f.read(PREVIEW_READ_BYTES)
+            # Incremental decoder tolerates a multibyte char cut off at the end
+            before_text = codecs.getincrementaldecoder("utf-8")().decode(raw)
+            before_truncated = p.stat().st_size > len(raw)
         except Exception:
             before_text = "<could not read existing file as utf-8>"
 
-    # Show preview panel
-    preview_body: list[str] = []
+    # Show preview panel. Headings are our markup; file contents are
+    # plain Text so brackets in them are never parsed as markup.
+    preview_body: list[Text] = []
 
-    preview_body.append(f"[bold]Path:[/bold] {p}")
-    preview_body.append(f"[bold]Mode:[/bold] {mode}")
-    preview_body.append("")
+    preview_body.append(Text.assemble(("Path:", "bold"), f" {p}"))
+    preview_body.append(Text.assemble(("Mode:", "bold"), f" {mode}"))
+    preview_body.append(Text())
     if before_exists:
-        preview_body.append("[bold]Existing content (first ~40 lines):[/bold]")
-        preview_body.append("")
+        preview_body.append(Text("Existing content (first ~40 lines):", style="bold"))
+        preview_body.append(Text())
 
         lines = before_text.splitlines()
         head = "\n".join(lines[:40])
-        preview_body.append(head if head else "<empty file>")
-        if len(lines) > 40:
-            preview_body.append("\n[dim][..TRUNCATED..][/dim]")
+        preview_body.append(Text(head if head else "<empty file>"))
+        if len(lines) > 40 or before_truncated:
+            preview_body.append(Text("\n[..TRUNCATED..]", style="dim"))
     else:
         preview_body.append(
-            "[bold yellow]File does not currently exist. It will be created.[/bold yellow]"
+            Text(
+                "File does not currently exist. It will be created.",
+                style="bold yellow",
+            )
         )
 
-    preview_body.append("")
-    preview_body.append("[bold]New content (first ~40 lines):[/bold]")
-    preview_body.append("")
+    preview_body.append(Text())
+    preview_body.append(Text("New content (first ~40 lines):", style="bold"))
+    preview_body.append(Text())
 
     new_lines = str(content).splitlines()
     new_head = "\n".join(new_lines[:40]) if new_lines else "<empty content>"
-    preview_body.append(new_head)
+    preview_body.append(Text(new_head))
     if len(new_lines) > 40:
-        preview_body.append("\n[dim][..TRUNCATED..][/dim]")
+        preview_body.append(Text("\n[..TRUNCATED..]", style="dim"))
 
     console.print(
         Panel(
-            "\n".join(preview_body),
+            Text("\n").join(preview_body),
             title="✏️ File Write Preview",
             border_style="blue",
         )
@@ -218,18 +367,23 @@ def _exec_write_file(action: Action) -> None:
     _print_result(result)
 
 
-def _exec_find_item(action: Action) -> None:
+def _fetch_find_item(action: Action) -> dict[str, Any] | None:
     name = str(action.args.get("name", "")).strip()
     max_results = int(action.args.get("max_results", 20))
-
     if not name:
+        return None
+    return tool_mod.find_item(name=name, max_results=max_results)
+
+
+def _exec_find_item(action: Action, fetched: Future | None = None) -> None:
+    result = fetched.result() if fetched else _fetch_find_item(action)
+
+    if result is None:
         console.print(
             "[yellow]Missing 'name' argument for find_item. Skipping.[/yellow]"
         )
         return
 
-    result = tool_mod.find_item(name=name, max_results=max_results)
-
     # Check if we have a high-confidence match (single file with 85%+ match score)
     should_offer_read = False
     best_file = None
@@ -273,49 +427,239 @@ def _exec_find_item(action: Action) -> None:
             _print_result(read_result)
 
 
-def _exec_summarize_file(action: Action) -> None:
+def _fetch_summarize_file(action: Action) -> dict[str, Any] | None:
     name = str(action.args.get("name", "")).strip()
     max_bytes = int(action.args.get("max_bytes", 10000))
-
     if not name:
+        return None
+    return tool_mod.summarize_file(name=name, max_bytes=max_bytes)
+
+
+def _summary_prompt(result: dict[str, Any]) -> str:
+    content = result["content_preview"]
+    file_path = result.get("file_path", "unknown file")
+    file_type = result.get("file_type", "text")
+
+    if file_type == "pdf":
+        return f"Please provide a concise summary of this PDF document ({file_path}):\n\n{content}"
+    return f"Please provide a concise summary of this file ({file_path}):\n\n{content}"
+
+
+def _summary_batches(
+    prepared: list[tuple[int, dict[str, Any]]],
+) -> list[list[tuple[int, dict[str, Any]]]]:
+    """
+    Group extracted files into batches of at most SUMMARY_BATCH_SIZE files
+    and SUMMARY_BATCH_CHARS characters of content, so a combined prompt
+    still fits comfortably in a small model's context window.
+    """
+    batches: list[list[tuple[int, dict[str, Any]]]] = []
+    current: list[tuple[int, dict[str, Any]]] = []
+    current_chars = 0
+
+    for i, result in prepared:
+        size = len(result["content_preview"])
+        if current and (
+            len(current) >= SUMMARY_BATCH_SIZE
+            or current_chars + size > SUMMARY_BATCH_CHARS
+        ):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append((i, result))
+        current_chars += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _summarize_batch(llm: LLMClient, results: list[dict[str, Any]]) -> list[str | None]:
+    """
+    Summarize several files with a single chat request.
+
+    Returns one summary per file, in order. Entries the model did not
+    answer (or a reply that is not a JSON array) come back as None so the
+    caller can fall back to summarizing those files one by one.
+    """
+    parts = [
+        f"Summarize each of the following {len(results)} files. "
+        "Respond ONLY with a JSON array containing one object per file, "
+        'in order, like [{"id": 1, "summary": "concise summary"}].'
+    ]
+    for n, result in enumerate(results, start=1):
+        kind = "PDF document" if result.get("file_type") == "pdf" else "file"
+        file_path = result.get("file_path", "unknown file")
+        parts.append(f"[{n}] {kind} {file_path}:\n{result['content_preview']}")
+
+    raw = llm.chat("\n\n".join(parts), mode="chat")
+
+    summaries: list[str | None] = [None] * len(results)
+    data = _extract_json(raw)
+    if not isinstance(data, list):
+        return summaries
+
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        n = item.get("id")
+        summary = item.get("summary")
+        if isinstance(n, int) and 1 <= n <= len(results) and isinstance(summary, str):
+            summaries[n - 1] = summary.strip() or None
+    return summaries
+
+
+# (summarize_file result, future of its batch's summaries, position in batch)
+_PreparedSummary = tuple[dict[str, Any] | None, Future | None, int]
+
+
+def _prepare_summaries(
+    actions: list[Action], start: int, llm: LLMClient
+) -> dict[int, _PreparedSummary]:
+    """
+    Extract every summarize_file target from 1-based index `start` up to
+    the next action that could modify files, then start summarizing them
+    in the background with as few LLM round-trips as possible.
+
+    The LLM calls run on a small thread pool, so file panels (and any
+    read-only actions in between) render while the model is working.
+    Plans with a single summarize_file action are left to the normal path.
+    """
+    targets: list[tuple[int, Action]] = []
+    for i, action in enumerate(actions[start - 1 :], start=start):
+        if action.tool == "summarize_file":
+            targets.append((i, action))
+        elif action.tool not in READ_ONLY:
+            break
+
+    if len(targets) < 2:
+        return {}
+
+    prepared: dict[int, _PreparedSummary] = {
+        i: (_fetch_summarize_file(action), None, 0) for i, action in targets
+    }
+    extracted = [
+        (i, result)
+        for i, (result, _, _) in prepared.items()
+        if result and result.get("ok") and result.get("content_preview")
+    ]
+    batches = _summary_batches(extracted)
+    if not batches:
+        return prepared
+
+    pool = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SUMMARIES, len(batches)))
+    for batch in batches:
+        results = [result for _, result in batch]
+        if len(batch) == 1:
+            future = pool.submit(
+                lambda r: [llm.chat(_summary_prompt(r), mode="chat")], results[0]
+            )
+        else:
+            future = pool.submit(_summarize_batch, llm, results)
+        for pos, (i, result) in enumerate(batch):
+            prepared[i] = (result, future, pos)
+    pool.shutdown(wait=False)
+
+    return prepared
+
+
+def _exec_summarize_file(
+    action: Action,
+    llm: LLMClient,
+    prepared: _PreparedSummary | None = None,
+) -> None:
+    if prepared is None:
+        result, pending, pos = _fetch_summarize_file(action), None, 0
+    else:
+        result, pending, pos = prepared
+
+    if result is None:
         console.print(
             "[yellow]Missing 'name' argument for summarize_file. Skipping.[/yellow]"
         )
         return
 
-    result = tool_mod.summarize_file(name=name, max_bytes=max_bytes)
     _print_result(result)
 
     # If content was successfully extracted, generate a summary using LLM
     if result.get("ok") and result.get("content_preview"):
-        from service.llm_client import LLMClient
+        summary = None
+        if pending is not None and pending.done():
+            summary = pending.result()[pos]
 
-        content = result["content_preview"]
-        file_path = result.get("file_path", "unknown file")
-        file_type = result.get("file_type", "text")
-
-        # Build a prompt for summarization
-        if file_type == "pdf":
-            prompt = f"Please provide a concise summary of this PDF document ({file_path}):\n\n{content}"
-        else:
-            prompt = f"Please provide a concise summary of this file ({file_path}):\n\n{content}"
+        if summary is None:
+            console.print()
+            console.print("[bold cyan]🤖 Generating summary...[/bold cyan]")
+            console.print()
 
-        console.print()
-        console.print("[bold cyan]🤖 Generating summary...[/bold cyan]")
-        console.print()
-
-        llm = LLMClient()
-        summary = llm.chat(prompt, mode="chat")
+            if pending is not None and not pending.done():
+                summary = pending.result()[pos]
+            if summary is None:
+                # Not batched, or the model left this file out of its reply
+                summary = llm.chat(_summary_prompt(result), mode="chat")
 
         console.print(
             Panel(
-                summary,
+                Text(summary),
                 title="🦧 Summary",
                 border_style="cyan",
             )
         )
 
 
+# Match score thresholds and their styles, best first
+_SCORE_STYLES = (("bold green", 0.9), ("yellow", 0.7), ("dim", 0.0))
+_DIR_LABEL = "📁 DIR"
+_FILE_LABEL = "📄 FILE"
+
+
+def _score_style(match_score: float) -> str:
+    for style, threshold in _SCORE_STYLES:
+        if match_score >= threshold:
+            return style
+    return _SCORE_STYLES[-1][0]
+
+
+def _make_find_table() -> Table:
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Match", justify="center", width=7)
+    table.add_column("Type", width=6)
+    table.add_column("Path", overflow="fold")
+    table.add_column("Size", justify="right", width=12)
+    return table
+
+
+def _make_listing_table() -> Table:
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Type", width=6)
+    table.add_column("Name", overflow="fold")
+    table.add_column("Size", justify="right", width=12)
+    table.add_column("Modified", width=16)
+    return table
+
+
+def _make_search_table() -> Table:
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("File", overflow="fold")
+    table.add_column("Line", justify="right", width=6)
+    table.add_column("Content", overflow="fold")
+    return table
+
+
+def _file_info_panel(info: dict[str, Any]) -> Panel:
+    lines = [
+        f"[bold]Path:[/bold] {info.get('path', '')}",
+        f"[bold]Type:[/bold] {info.get('type', '')}",
+        f"[bold]Size:[/bold] {info.get('size', '')}",
+        f"[bold]Created:[/bold] {info.get('created', '')}",
+        f"[bold]Modified:[/bold] {info.get('modified', '')}",
+        f"[bold]Accessed:[/bold] {info.get('accessed', '')}",
+        f"[bold]Permissions:[/bold] {info.get('permissions', '')}",
+    ]
+    return Panel("\n".join(lines), title="📋 File Information", border_style="cyan")
+
+
 def _print_result(result: dict[str, Any]) -> None:
     if not result.get("ok", False):
         console.print(
@@ -333,12 +677,18 @@ def _print_result(result: dict[str, Any]) -> None:
         stderr = result.get("stderr", "")
 
         meta = f"returncode={result['returncode']}"
+        if result.get("truncated_lines"):
+            meta += f" (showing last lines only, {result['truncated_lines']:,} earlier lines dropped)"
         console.print(Panel(meta, title="🦍 Command Result", border_style="green"))
 
         if stdout:
-            console.print(Panel(stdout.rstrip(), title="stdout", border_style="cyan"))
+            console.print(
+                Panel(Text(stdout.rstrip()), title="stdout", border_style="cyan")
+            )
         if stderr:
-            console.print(Panel(stderr.rstrip(), title="stderr", border_style="yellow"))
+            console.print(
+                Panel(Text(stderr.rstrip()), title="stderr", border_style="yellow")
+            )
         return
 
     # For read_file
@@ -346,9 +696,10 @@ def _print_result(result: dict[str, Any]) -> None:
         path = result.get("path", "<unknown>")
         truncated = result.get("truncated", False)
         title = f"📄 {path}"
-        body = result["content"]
+        # File content is untrusted: plain Text, never markup
+        body = Text(result["content"])
         if truncated:
-            body += "\n\n[dim][..TRUNCATED..][/dim]"
+            body.append("\n\n[..TRUNCATED..]", style="dim")
 
         console.print(Panel(body, title=title, border_style="blue"))
         return
@@ -397,26 +748,14 @@ def _print_result(result: dict[str, Any]) -> None:
             )
             return
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("#", style="dim", width=4)
-        table.add_column("Match", justify="center", width=7)
-        table.add_column("Type", width=6)
-        table.add_column("Path", overflow="fold")
-        table.add_column("Size", justify="right", width=12)
+        table = _make_find_table()
 
         for i, item in enumerate(results, start=1):
             match_score = item.get("match_score", 0)
-            # Color code the match score
-            if match_score >= 0.9:
-                score_style = "bold green"
-            elif match_score >= 0.7:
-                score_style = "yellow"
-            else:
-                score_style = "dim"
-
-            score_str = f"[{score_style}]{match_score:.0%}[/{score_style}]"
-            item_type = "📁 DIR" if item.get("is_dir", False) else "📄 FILE"
-            path = item.get("path", "<unknown>")
+            score_str = Text(f"{match_score:.0%}", style=_score_style(match_score))
+            item_type = _DIR_LABEL if item.get("is_dir", False) else _FILE_LABEL
+            # File names are raw text, never markup
+            path = Text(item.get("path", "<unknown>"))
             size = item.get("size")
             size_str = f"{size:,} bytes" if size is not None else "-"
 
@@ -479,9 +818,11 @@ def _print_result(result: dict[str, Any]) -> None:
 
         # Display the content for summarization
         # Limit to approximately 200 tokens worth of content (roughly 800 chars)
-        display_content = content[:800]
+        display_content = Text(content[:800])
         if len(content) > 800:
-            display_content += "\n\n[dim]...[content truncated for display][/dim]"
+            display_content.append(
+                "\n\n...[content truncated for display]", style="dim"
+            )
 
         console.print(
             Panel(
@@ -494,25 +835,15 @@ def _print_result(result: dict[str, Any]) -> None:
 
     # For get_file_info
     if "file_info" in result:
-        info = result["file_info"]
-
-        lines = [
-            f"[bold]Path:[/bold] {info.get('path', '')}",
-            f"[bold]Type:[/bold] {info.get('type', '')}",
-            f"[bold]Size:[/bold] {info.get('size', '')}",
-            f"[bold]Created:[/bold] {info.get('created', '')}",
-            f"[bold]Modified:[/bold] {info.get('modified', '')}",
-            f"[bold]Accessed:[/bold] {info.get('accessed', '')}",
-            f"[bold]Permissions:[/bold] {info.get('permissions', '')}",
-        ]
+        console.print(_file_info_panel(result["file_info"]))
+        return
 
-        console.print(
-            Panel(
-                "\n".join(lines),
-                title="📋 File Information",
-                border_style="cyan",
-            )
-        )
+    # For get_file_info with a list of paths
+    if "files" in result:
+        for info in result["files"]:
+            console.print(_file_info_panel(info))
+        if result.get("missing"):
+            console.print(f"[yellow]Not found:[/yellow] {', '.join(result['missing'])}")
         return
 
     # For copy_file and move_file
@@ -555,7 +886,7 @@ def _print_result(result: dict[str, Any]) -> None:
         else:
             console.print(
                 Panel(
-                    diff,
+                    Text(diff),
                     title=f"🦧 Comparing: {file1} ↔️ {file2}",
                     border_style="cyan",
                 )
@@ -593,14 +924,16 @@ def _print_result(result: dict[str, Any]) -> None:
     console.print(Panel("Success.", title="✅", border_style="green"))
 
 
-def _exec_list_directory(action: Action) -> None:
+def _fetch_list_directory(action: Action) -> dict[str, Any]:
     path = str(action.args.get("path", "."))
     show_hidden = bool(action.args.get("show_hidden", False))
     pattern = action.args.get("pattern")
 
-    result = tool_mod.list_directory(
-        path=path, show_hidden=show_hidden, pattern=pattern
-    )
+    return tool_mod.list_directory(path=path, show_hidden=show_hidden, pattern=pattern)
+
+
+def _exec_list_directory(action: Action, fetched: Future | None = None) -> None:
+    result = fetched.result() if fetched else _fetch_list_directory(action)
 
     if not result.get("ok"):
         _print_result(result)
@@ -619,17 +952,11 @@ def _exec_list_directory(action: Action) -> None:
         )
         return
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Type", width=6)
-    table.add_column("Name", overflow="fold")
-    table.add_column("Size", justify="right", width=12)
-    table.add_column("Modified", width=16)
-
-    import time
+    table = _make_listing_table()
 
     for item in items:
-        item_type = "📁 DIR" if item.get("is_dir") else "📄 FILE"
-        name = item.get("name", "")
+        item_type = _DIR_LABEL if item.get("is_dir") else _FILE_LABEL
+        name = Text(item.get("name", ""))
         size = item.get("size")
         size_str = f"{size:,}" if size is not None else "-"
         modified = item.get("modified", 0)
@@ -646,7 +973,7 @@ def _exec_list_directory(action: Action) -> None:
     )
 
 
-def _exec_search_content(action: Action) -> None:
+def _fetch_search_content(action: Action) -> dict[str, Any] | None:
     query = str(action.args.get("query", ""))
     path = str(action.args.get("path", "."))
     file_pattern = action.args.get("file_pattern")
@@ -654,10 +981,9 @@ def _exec_search_content(action: Action) -> None:
     case_sensitive = bool(action.args.get("case_sensitive", False))
 
     if not query:
-        console.print("[yellow]Missing 'query' argument for search_content.[/yellow]")
-        return
+        return None
 
-    result = tool_mod.search_content(
+    return tool_mod.search_content(
         query=query,
         path=path,
         file_pattern=file_pattern,
@@ -665,6 +991,15 @@ def _exec_search_content(action: Action) -> None:
         case_sensitive=case_sensitive,
     )
 
+
+def _exec_search_content(action: Action, fetched: Future | None = None) -> None:
+    query = str(action.args.get("query", ""))
+    result = fetched.result() if fetched else _fetch_search_content(action)
+
+    if result is None:
+        console.print("[yellow]Missing 'query' argument for search_content.[/yellow]")
+        return
+
     if not result.get("ok"):
         _print_result(result)
         return
@@ -681,16 +1016,13 @@ def _exec_search_content(action: Action) -> None:
         )
         return
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("File", overflow="fold")
-    table.add_column("Line", justify="right", width=6)
-    table.add_column("Content", overflow="fold")
+    table = _make_search_table()
 
     for i, match in enumerate(results, 1):
-        file = match.get("file", "")
+        # Paths and file lines are raw text, never markup
+        file = Text(match.get("file", ""))
         line_num = match.get("line_number", 0)
-        content = match.get("line_content", "")[:100]  # Limit line display
+        content = Text(match.get("line_content", "")[:100])  # Limit line display
 
         table.add_row(str(i), file, str(line_num), content)
 
@@ -708,14 +1040,23 @@ def _exec_search_content(action: Action) -> None:
     )
 
 
-def _exec_get_file_info(action: Action) -> None:
-    path = str(action.args.get("path", ""))
-
+def _fetch_get_file_info(action: Action) -> dict[str, Any] | None:
+    path = action.args.get("path", "")
+    if isinstance(path, list):
+        return tool_mod.get_file_info(path=[str(p) for p in path]) if path else None
+    path = str(path)
     if not path:
+        return None
+    return tool_mod.get_file_info(path=path)
+
+
+def _exec_get_file_info(action: Action, fetched: Future | None = None) -> None:
+    result = fetched.result() if fetched else _fetch_get_file_info(action)
+
+    if result is None:
         console.print("[yellow]Missing 'path' argument for get_file_info.[/yellow]")
         return
 
-    result = tool_mod.get_file_info(path=path)
     _print_result(result)
 
 
@@ -743,18 +1084,24 @@ def _exec_move_file(action: Action) -> None:
     _print_result(result)
 
 
-def _exec_compare_files(action: Action) -> None:
+def _fetch_compare_files(action: Action) -> dict[str, Any] | None:
     file1 = str(action.args.get("file1", ""))
     file2 = str(action.args.get("file2", ""))
     context_lines = int(action.args.get("context_lines", 3))
 
     if not file1 or not file2:
+        return None
+
+    return tool_mod.compare_files(file1=file1, file2=file2, context_lines=context_lines)
+
+
+def _exec_compare_files(action: Action, fetched: Future | None = None) -> None:
+    result = fetched.result() if fetched else _fetch_compare_files(action)
+
+    if result is None:
         console.print("[yellow]Missing file1 or file2 for compare_files.[/yellow]")
         return
 
-    result = tool_mod.compare_files(
-        file1=file1, file2=file2, context_lines=context_lines
-    )
     _print_result(result)
 
 
@@ -770,3 +1117,30 @@ def _exec_extract_archive(action: Action) -> None:
         archive_path=archive_path, destination=destination if destination else None
     )
     _print_result(result)
+
+
+# Tool call half of each READ_ONLY executor, safe to run off the main thread
+_FETCHERS = {
+    "read_file": _fetch_read_file,
+    "get_file_info": _fetch_get_file_info,
+    "list_directory": _fetch_list_directory,
+    "search_content": _fetch_search_content,
+    "find_item": _fetch_find_item,
+    "compare_files": _fetch_compare_files,
+}
+
+
+_DISPATCH = {
+    "run_shell": _exec_run_shell,
+    "read_file": _exec_read_file,
+    "write_file": _exec_write_file,
+    "find_item": _exec_find_item,
+    "summarize_file": _exec_summarize_file,
+    "list_directory": _exec_list_directory,
+    "search_content": _exec_search_content,
+    "get_file_info": _exec_get_file_info,
+    "copy_file": _exec_copy_file,
+    "move_file": _exec_move_file,
+    "compare_files": _exec_compare_files,
+    "extract_archive": _exec_extract_archive,
+}
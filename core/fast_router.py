@@ -0,0 +1,180 @@
+import re
+from pathlib import Path
+from typing import Callable, Optional
+
+from models import Action, Plan
+
+
+# Words that mean "the directory I'm in"
+_CWD_WORDS = {".", "current", "this", "here", "cwd"}
+
+# Pronouns and vague nouns that need the conversation (or the LLM) to
+# know what they refer to; never treat them as a literal file name
+_STOP_WORDS = {
+    "it",
+    "this",
+    "that",
+    "file",
+    "files",
+    "all",
+    "everything",
+    "duplicates",
+}
+
+_DIR_WORDS = r"(?:directory|folder|dir)"
+_PATHLIKE = r"(?:[~./]\S*|\S+/\S*|downloads?|documents?|desktop|home)"
+# Not text: "show report.pdf" or "display photo.png" needs the planner to
+# pick a tool, read_file would only dump bytes
+_BINARY_EXTS = {
+    ".pdf",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".bmp",
+    ".webp",
+    ".ico",
+    ".tiff",
+    ".zip",
+    ".tar",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".7z",
+    ".rar",
+    ".exe",
+    ".bin",
+    ".so",
+    ".dll",
+    ".mp3",
+    ".mp4",
+    ".mov",
+    ".wav",
+    ".docx",
+    ".xlsx",
+    ".pptx",
+}
+
+# A path, or a name with an extension: "notes.md", "./build", "src/main.py"
+_FILELIKE = r"(?:[~./]\S*|\S+/\S*|\S+\.\w+)"
+
+
+def _clean_path(raw: str) -> str:
+    path = raw.strip().strip("'\"`")
+    return "." if path.lower() in _CWD_WORDS else path
+
+
+def _target(raw: str) -> Optional[str]:
+    # For single-file tools: a stop word means "ask the LLM instead"
+    target = raw.strip().strip("'\"`")
+    return None if target.lower() in _STOP_WORDS else target
+
+
+def _plan(summary: str, tool: str, **args: str) -> Plan:
+    # Built from our own regex groups, so pydantic validation is skipped
+    return Plan.model_construct(
+        plan=summary, actions=[Action.model_construct(tool=tool, args=args)]
+    )
+
+
+def _list_directory(m: re.Match) -> Optional[Plan]:
+    path = _clean_path(m.group("path") or ".")
+    # "show the contents of notes.md" is about a file; unless the query
+    # called it a folder, leave anything with an extension to the planner
+    if not m.groupdict().get("dir") and Path(path).suffix:
+        return None
+    return _plan(f"List the contents of {path}.", "list_directory", path=path)
+
+
+def _read_file(m: re.Match) -> Optional[Plan]:
+    path = _target(m.group("path"))
+    if path is None or Path(path).suffix.lower() in _BINARY_EXTS:
+        return None
+    return _plan(f"Read the file {path}.", "read_file", path=path)
+
+
+def _find_item(m: re.Match) -> Optional[Plan]:
+    name = _target(m.group("name"))
+    if name is None:
+        return None
+    return _plan(f"Search for {name}.", "find_item", name=name)
+
+
+def _file_info(m: re.Match) -> Optional[Plan]:
+    path = _target(m.group("path"))
+    if path is None:
+        return None
+    return _plan(f"Show information about {path}.", "get_file_info", path=path)
+
+
+def _summarize_file(m: re.Match) -> Optional[Plan]:
+    name = _target(m.group("name"))
+    if name is None:
+        return None
+    return _plan(f"Summarize {name}.", "summarize_file", name=name)
+
+
+# Only unambiguous, single-path phrasings live here. Anything with more
+# than one step, a multi-word path or extra conditions goes to the LLM.
+_PATTERNS: list[tuple[str, Callable[[re.Match], Optional[Plan]]]] = [
+    (
+        r"^(?:list|ls|show)(?: me)?(?: all)?(?: the)? (?:files|contents|items)"
+        rf"(?: (?:in|of|inside)(?: my| the)? (?P<path>\S+)(?P<dir> {_DIR_WORDS})?)?$",
+        _list_directory,
+    ),
+    (
+        rf"^(?:list|ls)(?: my| the)? (?P<path>\S+)(?P<dir> {_DIR_WORDS})$",
+        _list_directory,
+    ),
+    (
+        # Bare "list X" only when X clearly is a folder, not "list processes"
+        rf"^(?:list|ls)(?: my| the)? (?P<path>{_PATHLIKE})$",
+        _list_directory,
+    ),
+    (
+        rf"^what(?:'s| is) in(?: my| the)? (?P<path>\S+)(?P<dir> {_DIR_WORDS})$",
+        _list_directory,
+    ),
+    (
+        r"^(?:read|cat|display|show)(?: me)?(?: the)?(?: file)?"
+        r" (?P<path>\S+\.\w+)$",
+        _read_file,
+    ),
+    (
+        r"^(?:find|locate|search for|where is)(?: my| the)?"
+        rf"(?: file| {_DIR_WORDS})?(?: named| called)? (?P<name>{_FILELIKE})$",
+        _find_item,
+    ),
+    (
+        r"^(?:show|get|give)(?: me)? (?:info|information|details|metadata)"
+        r" (?:about|for|on|of)(?: the)?(?: file)? (?P<path>\S+)$",
+        _file_info,
+    ),
+    (
+        rf"^summari[sz]e(?: the)?(?: file)? (?P<name>{_FILELIKE})$",
+        _summarize_file,
+    ),
+]
+
+# Case-insensitive so "List Downloads" routes but "Notes.MD" keeps its casing
+_ROUTES = [(re.compile(p, re.IGNORECASE), build) for p, build in _PATTERNS]
+
+
+def try_route(query: str) -> Optional[Plan]:
+    """
+    Map trivial `do` queries ("list downloads", "read notes.md",
+    "find readme") straight to a Plan without asking the LLM.
+
+    Returns None when the query isn't one of the known simple shapes;
+    the caller should then fall back to planner.get_action_plan.
+    """
+    text = " ".join(query.split()).rstrip(".!?")
+    # URLs aren't local paths
+    if "://" in text:
+        return None
+    for pattern, build in _ROUTES:
+        m = pattern.match(text)
+        if m:
+            return build(m)
+    return None
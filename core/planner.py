@@ -1,71 +1,80 @@
 import json
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Iterator, Optional
 
 from pydantic import ValidationError
 
 from service.llm_client import LLMClient
 from models import Plan
 
+try:
+    import orjson
 
-def _extract_json(raw: str) -> Optional[Dict[str, Any]]:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # except clauses below work with either decoder.
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_DECODER = json.JSONDecoder()
+
+# Opening fence with an optional language tag, then everything up to the
+# closing fence (or the end of the text if the model forgot to close it)
+_FENCE_RE = re.compile(r"```[a-zA-Z0-9_+-]*[ \t]*\n(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def _json_candidates(raw: str) -> Iterator[str]:
     """
-    Try to parse the model response as JSON. If it fails, try to strip
-    possible ```json ... ``` or ``` ... ``` fences. Return dict or None.
+    Yield the texts that may hold the JSON: the whole response, the
+    content of the first ```json ... ``` or ``` ... ``` fence, then the
+    first {...} object found anywhere in it.
     """
     raw = raw.strip()
     if not raw:
-        return None
-
-    # First attempt: direct JSON
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        pass
-
-    # Second attempt: strip markdown fences
-    if "```" in raw:
-        # Find the first code fence
-        start_idx = raw.find("```")
-        if start_idx != -1:
-            # Skip past the opening fence and optional language name
-            start_line_end = raw.find("\n", start_idx)
-            if start_line_end == -1:
-                return None
-
-            # Find the closing fence
-            end_idx = raw.find("```", start_line_end)
-            if end_idx != -1:
-                # Extract content between fences
-                json_content = raw[start_line_end + 1 : end_idx].strip()
-                try:
-                    return json.loads(json_content)
-                except json.JSONDecodeError:
-                    pass
-
-        # Fallback: try line-by-line approach
-        lines = raw.splitlines()
-        inner: list[str] = []
-        in_fence = False
-        for line in lines:
-            if line.strip().startswith("```"):
-                if not in_fence:
-                    in_fence = True
-                else:
-                    break  # Found closing fence
-                continue
-            if in_fence:
-                inner.append(line)
-
-        joined = "\n".join(inner).strip()
-        if joined:
-            try:
-                return json.loads(joined)
-            except json.JSONDecodeError:
-                pass
+        return
+
+    yield raw
+
+    match = _FENCE_RE.search(raw)
+    if match:
+        yield match.group(1).strip()
+
+    # Last resort: the first JSON object in the text, ignoring any prose
+    # the model wrote before or after it
+    start = raw.find("{")
+    if start != -1:
+        try:
+            _, end = _DECODER.raw_decode(raw, start)
+        except json.JSONDecodeError:
+            return
+        yield raw[start:end]
+
+
+def _extract_json(raw: str) -> Optional[Any]:
+    """
+    Try to parse the model response as JSON. If it fails, try to strip
+    possible ```json ... ``` or ``` ... ``` fences. Return the value or None.
+    """
+    for candidate in _json_candidates(raw):
+        try:
+            return _loads(candidate)
+        except json.JSONDecodeError:
+            continue
 
     return None
 
 
+def _parse_plan(raw: str) -> Optional[Plan]:
+    # model_validate_json parses and validates in one pass in pydantic-core;
+    # malformed JSON and schema mismatches both raise ValidationError.
+    for candidate in _json_candidates(raw):
+        try:
+            return Plan.model_validate_json(candidate)
+        except ValidationError:
+            continue
+    return None
+
+
 def get_action_plan(
     llm: LLMClient,
     user_query: str,
@@ -77,15 +86,15 @@ def get_action_plan(
     Returns:
         Plan instance or None if parsing / validation failed.
     """
-    raw = llm.chat(user_query=user_query, mode="action", tools_summary=tools)
-
-    data = _extract_json(raw)
-    if data is None:
-        return None
-
-    try:
-        plan = Plan.model_validate(data)
-    except ValidationError:
-        return None
-
-    return plan
+    parsed: dict[str, Optional[Plan]] = {}
+
+    def accept(raw: str) -> bool:
+        # Only a reply that parses as a Plan is worth caching; remember the
+        # result so the returned reply isn't validated twice
+        parsed[raw] = _parse_plan(raw)
+        return parsed[raw] is not None
+
+    raw = llm.chat(
+        user_query=user_query, mode="action", tools_summary=tools, accept=accept
+    )
+    return parsed[raw] if raw in parsed else _parse_plan(raw)
@@ -1,17 +1,73 @@
+import codecs
+import errno
+import filecmp
+import fnmatch
+import functools
+import heapq
+import io
+import mmap
 import os
+import re
+import shutil
+import stat
 import subprocess
+import sys
+import tarfile
 import textwrap
+import threading
+import zipfile
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import AnyStr, Callable, Dict, Any, Iterator, List, Sequence
 from difflib import SequenceMatcher
 
 try:
     import pdfplumber
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdftypes import resolve1
 
     HAS_PDF_SUPPORT = True
 except ImportError:
     HAS_PDF_SUPPORT = False
 
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.fuzz import ratio as _rf_ratio
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    from diff_match_patch import diff_match_patch as _DiffMatchPatch
+
+    HAS_DIFF_MATCH_PATCH = True
+except ImportError:
+    HAS_DIFF_MATCH_PATCH = False
+
+
+# Common folder names users (and the model) say instead of real paths
+_HOME = Path.home()
+_FOLDER_MAPPING = {
+    "downloads": _HOME / "Downloads",
+    "download": _HOME / "Downloads",
+    "documents": _HOME / "Documents",
+    "document": _HOME / "Documents",
+    "desktop": _HOME / "Desktop",
+    "home": _HOME,
+}
+
 
 def _normalize_path(path: str) -> Path:
     """
@@ -21,21 +77,21 @@ def _normalize_path(path: str) -> Path:
     Also resolves common folder names like 'downloads', 'documents', 'desktop'
     to their actual paths.
     """
+    return _normalize_path_cached(path, os.getcwd())
+
+
+# Plans keep referring to the same few paths, and resolve() costs a realpath
+# walk each time. Relative paths resolve against cwd, so it's part of the key;
+# _invalidate_find_cache() clears this too, since symlinks can change under us.
+@functools.lru_cache(maxsize=1024)
+def _normalize_path_cached(path: str, cwd: str) -> Path:
     p = path.strip()
 
     # Treat backslashes as path separators (so '.\\foo\\bar.txt' works)
     p = p.replace("\\", "/")
 
     # Map common folder names to actual paths
-    home = Path.home()
-    folder_mapping = {
-        "downloads": home / "Downloads",
-        "download": home / "Downloads",
-        "documents": home / "Documents",
-        "document": home / "Documents",
-        "desktop": home / "Desktop",
-        "home": home,
-    }
+    folder_mapping = _FOLDER_MAPPING
 
     # Split path into parts
     parts = p.split("/")
@@ -86,7 +142,39 @@ def _normalize_path(path: str) -> Path:
     return Path(p).expanduser().resolve()
 
 
-def _fuzzy_match_score(query: str, target: str) -> float:
+_matcher_local = threading.local()
+
+
+def _similarity(query: str, target: str, cutoff: float = 0.0) -> float:
+    """
+    Normalized edit similarity in [0, 1]; rapidfuzz's C++ ratio if available.
+
+    Scores below `cutoff` may be reported as 0.0, which lets both backends
+    bail out before doing the full comparison.
+
+    Jaro-Winkler was tried here and rejected: on short file names it scores
+    unrelated strings around 0.6-0.7, so at find_item's 0.6 threshold it
+    let through ~50-100x more junk than this ratio, and the names it rates
+    highly (>= 0.9) already pass with this ratio anyway.
+    """
+    if HAS_RAPIDFUZZ:
+        return _rf_ratio(query, target, score_cutoff=cutoff * 100) / 100.0
+
+    # One matcher per thread. SequenceMatcher indexes seq2, so the query
+    # goes there and is only re-indexed when it changes.
+    matcher = getattr(_matcher_local, "matcher", None)
+    if matcher is None:
+        matcher = _matcher_local.matcher = SequenceMatcher(None)
+    matcher.set_seq2(query)
+    matcher.set_seq1(target)
+
+    # Cheap upper bounds first; most unrelated names stop here
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
+
+
+def _fuzzy_match_score(query: str, target: str, threshold: float = 0.0) -> float:
     """
     Calculate a fuzzy match score between query and target strings.
     Returns a score between 0 and 1, where 1 is a perfect match.
@@ -95,10 +183,50 @@ def _fuzzy_match_score(query: str, target: str) -> float:
     1. Exact substring match (highest priority)
     2. Sequence matching (handles typos and partial matches)
     3. Extension-agnostic matching (if query has no extension)
+
+    Candidates that can't reach `threshold` may score 0.0 early.
     """
-    query_lower = query.lower()
-    target_lower = target.lower()
+    target_lower = target.casefold()
+    return _score_lowered(
+        query.casefold(), _has_ext(query), target_lower, _stem(target_lower), threshold
+    )
+
+
+def _has_ext(name: str) -> bool:
+    return "." in name and not name.endswith(".")
+
+
+def _stem(name: str) -> str:
+    """Path(name).stem with plain string ops (no Path object per name)."""
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
 
+
+def _score_lowered(
+    query_lower: str,
+    query_has_ext: bool,
+    target_lower: str,
+    target_stem: str,
+    threshold: float = 0.0,
+) -> float:
+    """_fuzzy_match_score on inputs that are already casefolded and split."""
+    score = _shortcut_score(query_lower, query_has_ext, target_lower, target_stem)
+    if score is not None:
+        return score
+
+    # Fuzzy matching (handles typos)
+    # Compare against both full name and stem
+    full_ratio = _similarity(query_lower, target_lower, threshold)
+    stem_ratio = _similarity(query_lower, target_stem, threshold / 1.05)
+
+    # Return the best score, with a slight preference for stem matches
+    return max(full_ratio, stem_ratio * 1.05)
+
+
+def _shortcut_score(
+    query_lower: str, query_has_ext: bool, target_lower: str, target_stem: str
+) -> float | None:
+    """Fixed scores for exact/substring matches; None means "needs fuzzy"."""
     # Perfect match
     if query_lower == target_lower:
         return 1.0
@@ -111,10 +239,6 @@ def _fuzzy_match_score(query: str, target: str) -> float:
         return 0.85
 
     # Try matching without extension if query has no extension
-    query_has_ext = "." in query and not query.endswith(".")
-    target_path = Path(target)
-    target_stem = target_path.stem.lower()
-
     if not query_has_ext:
         # Query has no extension, try matching against filename without extension
         if query_lower == target_stem:
@@ -124,24 +248,58 @@ def _fuzzy_match_score(query: str, target: str) -> float:
                 return 0.8
             return 0.7
 
-    # Use SequenceMatcher for fuzzy matching (handles typos)
-    # Compare against both full name and stem
-    full_ratio = SequenceMatcher(None, query_lower, target_lower).ratio()
-    stem_ratio = SequenceMatcher(None, query_lower, target_stem).ratio()
+    return None
 
-    # Return the best score, with a slight preference for stem matches
-    return max(full_ratio, stem_ratio * 1.05)
 
+def _score_names(query: str, names: List[str], threshold: float) -> List[float]:
+    """
+    _fuzzy_match_score for many names at once.
 
-def get_tool_specs() -> str:
+    With rapidfuzz the fuzzy ratios for the whole list are computed in one
+    C++ call (process.extract, which returns only the names at or above the
+    cutoff); without it this is a plain per-name loop.
     """
-    Return a string describing the tools and their argument schemas
-    to inject into the ACTION system prompt.
+    # Query prep happens once, not per name. casefold() rather than lower()
+    # so e.g. "straße" and "STRASSE" compare equal; rapidfuzz gets the
+    # folded strings with processor=None and does no case work of its own.
+    query_lower = query.casefold()
+    query_has_ext = _has_ext(query)
+    lowers = [name.casefold() for name in names]
+    stems = [_stem(name) for name in lowers]
+
+    if not HAS_RAPIDFUZZ:
+        return [
+            _score_lowered(query_lower, query_has_ext, lower, stem, threshold)
+            for lower, stem in zip(lowers, stems)
+        ]
 
-    This text is what the model sees as {{TOOLS}}.
+    def ratios(targets: List[str], cutoff: float) -> Dict[int, float]:
+        matches = _rf_process.extract(
+            query_lower,
+            targets,
+            scorer=_rf_ratio,
+            processor=None,
+            score_cutoff=cutoff * 100,
+            limit=None,
+        )
+        return {i: score / 100.0 for _, score, i in matches}
+
+    full = ratios(lowers, threshold)
+    stem = ratios(stems, threshold / 1.05)
+
+    scores: List[float] = []
+    for i, (target_lower, target_stem) in enumerate(zip(lowers, stems)):
+        score = _shortcut_score(query_lower, query_has_ext, target_lower, target_stem)
+        if score is None:
+            score = max(full.get(i, 0.0), stem.get(i, 0.0) * 1.05)
+        scores.append(score)
+    return scores
+
+
+# What the model sees as {{TOOLS}} in the ACTION prompt. Dedented once at
+# import; get_tool_specs() just hands out the same string.
+_TOOL_SPECS = textwrap.dedent(
     """
-    return textwrap.dedent(
-        """
         1. \"run_shell\"
            - description: Run a shell command and capture stdout/stderr.
            - args schema:
@@ -239,11 +397,12 @@ def get_tool_specs() -> str:
              Returns size, dates, permissions, type, and other information.
            - args schema:
              {
-               "path": "string, path to the file"
+               "path": "string, path to the file (or a list of paths)"
              }
            - notes:
              - Shows: size, creation date, modification date, file type, permissions.
              - Works with common folder shortcuts like 'downloads/file.txt'.
+             - Pass a list of paths to inspect several files in one action.
              - Useful for checking file properties before operations.
 
         9. "copy_file"
@@ -299,21 +458,364 @@ def get_tool_specs() -> str:
               - Creates destination directory if needed.
               - Lists extracted files.
         """
-    ).strip()
+).strip()
+
+
+def get_tool_specs() -> str:
+    """
+    Return a string describing the tools and their argument schemas
+    to inject into the ACTION system prompt.
+
+    This text is what the model sees as {{TOOLS}}.
+    """
+    return _TOOL_SPECS
+
+
+# ---------- Directory walk helpers ----------
+
+# Directories that are never worth descending into when searching
+_SKIP_DIRS = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", ".mypy_cache"}
+)
+
+
+def _walk_scandir(root: str | Path) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry under `root` using os.scandir.
+
+    DirEntry carries the file type from the directory read itself, so the
+    walk costs one getdents per directory instead of a stat per path, and
+    callers only stat the entries they actually report. Hidden and noise
+    directories (.git, node_modules, ...) are yielded but not descended
+    into, and neither are symlinked directories. Unreadable directories
+    are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                yield entry
+                try:
+                    descend = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if descend and not (
+                    entry.name.startswith(".") or entry.name in _SKIP_DIRS
+                ):
+                    stack.append(entry.path)
+
+
+# find_item's per-root listing, reused while the root's mtime is unchanged.
+# Tools that change the filesystem call _invalidate_find_cache(), since a
+# change deeper in the tree doesn't touch the root's mtime.
+_FIND_INDEX: dict[Path, tuple[int, list[os.DirEntry]]] = {}
+
+
+def _invalidate_find_cache() -> None:
+    _FIND_INDEX.clear()
+    _normalize_path_cached.cache_clear()
+
+
+def _find_index(root: Path, fresh: bool = False) -> list[os.DirEntry]:
+    try:
+        mtime = root.stat().st_mtime_ns
+    except OSError:
+        return []
+    cached = _FIND_INDEX.get(root)
+    if cached is not None and cached[0] == mtime and not fresh:
+        return cached[1]
+    entries = list(_walk_scandir(root))
+    _FIND_INDEX[root] = (mtime, entries)
+    return entries
+
+
+# ---------- File read helpers ----------
+
+
+def _read_head(path: str | Path, max_bytes: int) -> tuple[bytes, int]:
+    """
+    Return (first max_bytes of the file, file size) without reading the
+    rest of the file. Uses a single positional pread where available.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        file_size = os.fstat(fd).st_size
+        if hasattr(os, "pread"):
+            data = os.pread(fd, max_bytes, 0)
+        else:
+            data = os.read(fd, max_bytes)
+    finally:
+        os.close(fd)
+    return data, file_size
+
+
+# ---------- File copy helpers ----------
+
+# errno values meaning "this kernel copy can't handle this pair of files"
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
+
+# Chunk for the user-space fallback; big enough that syscall count is noise
+_COPY_BUFSIZE = 1 << 20
+
+# Linux ioctl making dst a copy-on-write clone of src: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+_CAN_REFLINK = HAS_FCNTL and sys.platform.startswith("linux")
+# ext4 and tmpfs answer FICLONE with ENOTTY/EOPNOTSUPP rather than ENOSYS
+_REFLINK_UNSUPPORTED = _KERNEL_COPY_UNSUPPORTED | {errno.ENOTTY}
+
+
+def _kernel_copy(copy_chunk: Callable[[], int]) -> bool:
+    """
+    Call `copy_chunk` until it reports 0 bytes. Returns False if nothing
+    was copied, either because the very first call says the syscall isn't
+    usable here or because it returned 0 straight away (procfs, sysfs and
+    some FUSE files report size 0 to copy_file_range), so the caller can
+    try the next method. 0 only means EOF once some data has been copied;
+    any failure after that is a real error and is raised.
+    """
+    copied = False
+    try:
+        while copy_chunk():
+            copied = True
+    except OSError as e:
+        if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+            raise
+        return False
+    return copied
+
+
+def _copy_fds(src_fd: int, dst_fd: int) -> None:
+    # 0. FICLONE reflink (btrfs, XFS, bcachefs): dst shares src's data
+    #    blocks, so the "copy" is one metadata update whatever the size
+    if _CAN_REFLINK:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError as e:
+            if e.errno not in _REFLINK_UNSUPPORTED:
+                raise
+
+    # 1. copy_file_range: no user-space round trip, and filesystems such as
+    #    NFS or btrfs can do the copy server-side / as a clone
+    if hasattr(os, "copy_file_range") and _kernel_copy(
+        lambda: os.copy_file_range(src_fd, dst_fd, 1 << 30)
+    ):
+        return
+
+    # 2. sendfile: still in-kernel; file-to-file works on Linux
+    if hasattr(os, "sendfile") and _kernel_copy(
+        lambda: os.sendfile(dst_fd, src_fd, None, 1 << 30)
+    ):
+        return
+
+    # 3. Plain read/write through one reused 1 MiB buffer
+    buf = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(src_fd, "rb", buffering=0, closefd=False) as fsrc:
+        while n := fsrc.readinto(buf):
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, view[written:n])
+
+
+def _fastcopy(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst with the same result as shutil.copy2, keeping the
+    data inside the kernel where possible.
+
+    Works on raw file descriptors (no buffered file objects) and tries a
+    FICLONE reflink, then copy_file_range, then sendfile, then a 1 MiB
+    read/write loop.
+    """
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        dst_fd = os.open(
+            dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666
+        )
+        try:
+            _copy_fds(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
 
 
 # ---------- Tool implementations ----------
 
 
+# Extensions treated as text by summarize_file and searched by
+# search_content when no file_pattern is given. Files without an
+# extension are always treated as text.
+_TEXT_EXTS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".py",
+        ".js",
+        ".jsx",
+        ".ts",
+        ".tsx",
+        ".json",
+        ".xml",
+        ".html",
+        ".css",
+        ".scss",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".java",
+        ".c",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".rs",
+        ".go",
+        ".rb",
+        ".php",
+        ".swift",
+        ".kt",
+        ".r",
+        ".sql",
+        ".log",
+        ".csv",
+        ".rst",
+        ".tex",
+        ".jsonl",
+        ".mjs",
+        ".cjs",
+        ".htm",
+        ".tsv",
+        ".cs",
+        ".lua",
+        ".pl",
+        ".vue",
+        ".svelte",
+        ".bat",
+        ".ps1",
+        ".env",
+        ".properties",
+        ".gradle",
+        ".cmake",
+        ".mk",
+    }
+)
+
+
+# Anything that needs the shell's own parsing: pipes, redirects, globs,
+# expansions, quoting, comments, multiple commands...
+_SHELL_META = frozenset("|&;<>$`*?[]{}()\"'\\\n~#!=%")
+
+# Builtins only exist inside a shell, or behave differently from the
+# /bin program of the same name (dash's echo takes no -e, printf and test
+# differ in corner cases), so they always go through the shell
+_SHELL_BUILTINS = frozenset(
+    {
+        "echo",
+        "printf",
+        "test",
+        "[",
+        "pwd",
+        "kill",
+        "true",
+        "false",
+        ":",
+        "times",
+        "break",
+        "continue",
+        "enable",
+        "help",
+        "logout",
+        "mapfile",
+        "readarray",
+        "caller",
+        "disown",
+        "suspend",
+        "fc",
+        "cd",
+        "export",
+        "source",
+        ".",
+        "alias",
+        "unalias",
+        "set",
+        "unset",
+        "exit",
+        "exec",
+        "eval",
+        "ulimit",
+        "umask",
+        "type",
+        "hash",
+        "history",
+        "jobs",
+        "fg",
+        "bg",
+        "wait",
+        "read",
+        "trap",
+        "shopt",
+        "pushd",
+        "popd",
+        "dirs",
+        "time",
+        "command",
+        "builtin",
+        "let",
+        "declare",
+        "typeset",
+        "local",
+        "readonly",
+        "shift",
+        "return",
+        "getopts",
+    }
+)
+
+
+def _command_argv(command: str) -> list[str] | str:
+    """
+    Split a plain "program arg arg" command into argv so it can be run
+    without starting /bin/sh first. Anything the shell would interpret is
+    returned unchanged, to be run with shell=True as before.
+    """
+    if _SHELL_META.intersection(command):
+        return command
+    argv = command.split()
+    if not argv or argv[0] in _SHELL_BUILTINS or shutil.which(argv[0]) is None:
+        # Unknown programs go through the shell too, so errors look the same
+        return command
+    return argv
+
+
 def run_shell(command: str) -> Dict[str, Any]:
     """
     Run a shell command safely. This is still powerful, so we do basic
     guardrails in executor before calling this.
     """
+    _invalidate_find_cache()
+    args = _command_argv(command)
     try:
         completed = subprocess.run(
-            command,
-            shell=True,
+            args,
+            shell=isinstance(args, str),
             capture_output=True,
             text=True,
             check=False,
@@ -328,17 +830,96 @@ def run_shell(command: str) -> Dict[str, Any]:
         return {"ok": False, "error": str(e)}
 
 
+def stream_shell(
+    command: str,
+    on_progress: Callable[[List[str], List[str]], None] | None = None,
+    max_lines: int = 2000,
+    quick_timeout: float = 0.2,
+    poll_interval: float = 0.1,
+) -> Dict[str, Any]:
+    """
+    Run a shell command like run_shell, but drain stdout/stderr while it
+    runs and keep only the last `max_lines` lines of each, so memory stays
+    bounded however much the command prints.
+
+    Commands that finish within `quick_timeout` seconds behave exactly like
+    run_shell. For longer ones, `on_progress(stdout_lines, stderr_lines)`
+    is called every `poll_interval` seconds with the current tails so the
+    caller can show live output.
+    """
+    _invalidate_find_cache()
+    args = _command_argv(command)
+    try:
+        proc = subprocess.Popen(
+            args,
+            shell=isinstance(args, str),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+    except Exception as e:  # noqa: BLE001
+        return {"ok": False, "error": str(e)}
+
+    lock = threading.Lock()
+    tails = (deque(maxlen=max_lines), deque(maxlen=max_lines))
+    dropped = [0, 0]
+
+    def _drain(stream, idx: int) -> None:
+        for line in stream:
+            with lock:
+                if len(tails[idx]) == max_lines:
+                    dropped[idx] += 1
+                tails[idx].append(line)
+        stream.close()
+
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, 0), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, 1), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    timeout = quick_timeout
+    while True:
+        try:
+            proc.wait(timeout=timeout)
+            break
+        except subprocess.TimeoutExpired:
+            if on_progress is not None:
+                with lock:
+                    stdout_lines, stderr_lines = list(tails[0]), list(tails[1])
+                on_progress(stdout_lines, stderr_lines)
+            timeout = poll_interval
+
+    for reader in readers:
+        reader.join()
+
+    return {
+        "ok": True,
+        "returncode": proc.returncode,
+        "stdout": "".join(tails[0]),
+        "stderr": "".join(tails[1]),
+        "truncated_lines": dropped[0] + dropped[1],
+    }
+
+
 def read_file(path: str, max_bytes: int = 5000) -> Dict[str, Any]:
     try:
         p = _normalize_path(path)
-        data = p.read_bytes()
+        # Never read past what will be shown; one extra byte tells us
+        # whether there was more (works for /proc-style files too)
+        data, _ = _read_head(p, max_bytes + 1)
         snippet = data[:max_bytes]
+        truncated = len(data) > max_bytes
         try:
-            text = snippet.decode("utf-8", errors="replace")
+            # When cut short, drop a multibyte character split at the end
+            # instead of showing it as U+FFFD
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            text = decoder.decode(snippet, final=not truncated)
         except Exception as e:  # noqa: BLE001
             return {"ok": False, "error": f"decode error: {e}"}
-
-        truncated = len(data) > max_bytes
         return {
             "ok": True,
             "path": str(p),
@@ -359,6 +940,7 @@ def write_file(path: str, content: str, mode: str = "overwrite") -> Dict[str, An
       - 'overwrite': replace entire file (truncate or create).
       - 'append'   : append to the end of the file (create if missing).
     """
+    _invalidate_find_cache()
     try:
         p = _normalize_path(path)
 
@@ -402,8 +984,73 @@ def write_file(path: str, content: str, mode: str = "overwrite") -> Dict[str, An
         return {"ok": False, "error": str(e)}
 
 
+def _walk_and_score(
+    root: Path, query: str, threshold: float, fresh: bool = False
+) -> List[tuple[float, os.DirEntry]]:
+    """(score, entry) for every entry under `root` scoring at least `threshold`."""
+    entries = _find_index(root, fresh)
+    # Score every name in one batch
+    scores = _score_names(query, [e.name for e in entries], threshold)
+    return [(score, e) for score, e in zip(scores, entries) if score >= threshold]
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _walked_from(root: Path, path: Path) -> bool:
+    """True if a _walk_scandir(root) walk reaches `path`."""
+    if not path.is_relative_to(root):
+        return False
+    return not any(
+        part.startswith(".") or part in _SKIP_DIRS
+        for part in path.relative_to(root).parts
+    )
+
+
+def _dedupe_roots(roots: List[Path]) -> List[Path]:
+    """
+    Drop roots that another root's walk already covers: the same directory
+    under another name (same device and inode, e.g. via a symlink or bind
+    mount) or a directory nested inside another root, such as ~/Downloads
+    when running from ~. Order is kept otherwise.
+    """
+    kept: List[Path] = []
+    seen_inodes = set()
+    for root in roots:
+        try:
+            rp = root.resolve()
+            st = rp.stat()
+        except OSError:
+            continue
+        key = (st.st_dev, st.st_ino)
+        if key in seen_inodes or any(_walked_from(k, rp) for k in kept):
+            continue
+        seen_inodes.add(key)
+        # A new root may also contain roots kept earlier
+        kept = [k for k in kept if not _walked_from(rp, k)]
+        kept.append(rp)
+    return kept
+
+
+def _exact_hits(
+    root: Path, query: str, fresh: bool = False
+) -> List[tuple[float, os.DirEntry]]:
+    """Entries under `root` named exactly `query` (ignoring case), scored 1.0."""
+    query_lower = query.casefold()
+    return [
+        (1.0, e) for e in _find_index(root, fresh) if e.name.casefold() == query_lower
+    ]
+
+
+def _is_file_entry(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
 def find_item(
-    name: str, max_results: int = 20, fuzzy_threshold: float = 0.6
+    name: str, max_results: int = 20, fuzzy_threshold: float = 0.6, fresh: bool = False
 ) -> Dict[str, Any]:
     """
     Search for files/directories using fuzzy matching.
@@ -425,6 +1072,7 @@ def find_item(
       name: Filename or fragment to search for
       max_results: Maximum number of results to return
       fuzzy_threshold: Minimum similarity score (0-1) to include a result
+      fresh: Re-walk the roots even if a cached listing is still valid
 
     Returns:
       {
@@ -457,53 +1105,59 @@ def find_item(
         if candidate.exists():
             roots.append(candidate)
 
-    # Deduplicate roots
-    unique_roots: List[Path] = []
-    seen = set()
-    for r in roots:
-        rp = r.resolve()
-        if rp in seen:
-            continue
-        seen.add(rp)
-        unique_roots.append(rp)
-    roots = unique_roots
-
-    # Collect all candidates with their scores
-    candidates: List[Dict[str, Any]] = []
+    roots = _dedupe_roots(roots)
+
+    # Walk and score each root on its own thread; the walks are I/O bound
+    # and the roots are usually separate trees
+    with ThreadPoolExecutor(max_workers=max(1, len(roots))) as pool:
+        per_root = None
+        if len(query) >= 3 and not _GLOB_CHARS.intersection(query):
+            # The user usually types the real file name: if some file
+            # matches it exactly, skip fuzzy scoring altogether. Exact hits
+            # that are only directories (a notes/ folder next to notes.md)
+            # don't count, so callers after a file still see the fuzzy ones.
+            exact = list(pool.map(lambda root: _exact_hits(root, query, fresh), roots))
+            if any(_is_file_entry(e) for hits in exact for _, e in hits):
+                per_root = exact
+        if per_root is None:
+            per_root = list(
+                pool.map(
+                    lambda root: _walk_and_score(root, query, fuzzy_threshold, fresh),
+                    roots,
+                )
+            )
 
-    for root in roots:
+    # Best max_results matches, best first, without sorting everything.
+    # Chained in root order so ties keep their walk order.
+    best = heapq.nlargest(
+        max_results,
+        (
+            (score, root, entry)
+            for root, hits in zip(roots, per_root)
+            for score, entry in hits
+        ),
+        key=lambda hit: hit[0],
+    )
+
+    results: List[Dict[str, Any]] = []
+    for score, root, entry in best:
+        # Only reported matches get stat'ed
         try:
-            for path in root.rglob("*"):
-                # Calculate fuzzy match score
-                score = _fuzzy_match_score(query, path.name)
-
-                # Only include if score meets threshold
-                if score >= fuzzy_threshold:
-                    try:
-                        is_dir = path.is_dir()
-                        size = path.stat().st_size if path.is_file() else None
-                    except OSError:
-                        is_dir = path.is_dir()
-                        size = None
-
-                    candidates.append(
-                        {
-                            "path": str(path),
-                            "root": str(root),
-                            "is_dir": is_dir,
-                            "size": size,
-                            "match_score": score,
-                        }
-                    )
-        except Exception:
-            # Ignore unreadable roots
-            continue
-
-    # Sort by match score (best matches first)
-    candidates.sort(key=lambda x: x["match_score"], reverse=True)
-
-    # Limit to max_results
-    results = candidates[:max_results]
+            is_dir = entry.is_dir()
+            size = entry.stat().st_size if entry.is_file() else None
+        except OSError:
+            is_dir = False
+            size = None
+
+        results.append(
+            {
+                "path": entry.path,
+                "root": str(root),
+                "is_dir": is_dir,
+                "size": size,
+                "match_score": score,
+            }
+        )
 
     return {
         "ok": True,
@@ -514,6 +1168,47 @@ def find_item(
     }
 
 
+def _extract_pdf_text(path: str, max_chars: int) -> tuple[str, bool, int | None]:
+    """
+    Extract text from the first pages of a PDF, up to `max_chars`.
+
+    Pages are parsed one at a time and extraction stops as soon as enough
+    text has been collected, so later pages are never laid out (pdf.pages
+    would build every page up front). The page count comes from the page
+    tree's /Count entry instead.
+
+    Returns (text, truncated, page_count).
+    """
+    with pdfplumber.open(path) as pdf:
+        try:
+            page_count = int(resolve1(pdf.doc.catalog["Pages"])["Count"])
+        except Exception:  # noqa: BLE001
+            page_count = None
+
+        buf = io.StringIO()
+        total_chars = 0
+        more = False
+        for number, page_obj in enumerate(PDFPage.create_pages(pdf.doc), 1):
+            if total_chars >= max_chars:
+                # Enough text already; there is at least one more page
+                more = True
+                break
+            page = pdfplumber.page.Page(pdf, page_obj, page_number=number)
+            page_text = page.extract_text()
+            page.close()
+            if page_text:
+                if total_chars:
+                    buf.write("\n\n")
+                    total_chars += 2
+                buf.write(page_text)
+                total_chars += len(page_text)
+
+    content = buf.getvalue()
+    if len(content) > max_chars:
+        return content[:max_chars], True, page_count
+    return content, more, page_count
+
+
 def summarize_file(name: str, max_bytes: int = 10000) -> Dict[str, Any]:
     """
     Find a file and generate a summary of its contents.
@@ -569,49 +1264,6 @@ def summarize_file(name: str, max_bytes: int = 10000) -> Dict[str, Any]:
     file_path = best_match["path"]
     match_score = best_match.get("match_score", 0)
 
-    # Check if it's a readable text file by extension
-    text_extensions = {
-        ".txt",
-        ".md",
-        ".py",
-        ".js",
-        ".jsx",
-        ".ts",
-        ".tsx",
-        ".json",
-        ".xml",
-        ".html",
-        ".css",
-        ".scss",
-        ".yaml",
-        ".yml",
-        ".toml",
-        ".ini",
-        ".cfg",
-        ".conf",
-        ".sh",
-        ".bash",
-        ".zsh",
-        ".fish",
-        ".java",
-        ".c",
-        ".cpp",
-        ".h",
-        ".hpp",
-        ".rs",
-        ".go",
-        ".rb",
-        ".php",
-        ".swift",
-        ".kt",
-        ".r",
-        ".sql",
-        ".log",
-        ".csv",
-        ".rst",
-        ".tex",
-    }
-
     file_ext = Path(file_path).suffix.lower()
 
     # Special handling for PDFs
@@ -629,71 +1281,41 @@ def summarize_file(name: str, max_bytes: int = 10000) -> Dict[str, Any]:
 
             file_size = p.stat().st_size
 
-            # Extract text from PDF using pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                text_parts = []
-                total_chars = 0
-
-                # Extract text from each page until we reach max_bytes
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                        total_chars += len(page_text)
-
-                        # Stop if we've extracted enough
-                        if total_chars >= max_bytes:
-                            break
-
-                content = "\n\n".join(text_parts)
-
-                # Limit to max_bytes
-                if len(content) > max_bytes:
-                    content = content[:max_bytes]
-                    truncated = True
-                else:
-                    truncated = len(pdf.pages) > len(text_parts)
-
-                if not content.strip():
-                    return {
-                        "ok": False,
-                        "error": f"Could not extract text from PDF. It may be image-based or encrypted.",
-                    }
+            content, truncated, page_count = _extract_pdf_text(file_path, max_bytes)
 
+            if not content.strip():
                 return {
-                    "ok": True,
-                    "query": name,
-                    "file_path": file_path,
-                    "file_size": file_size,
-                    "match_score": match_score,
-                    "content_preview": content,
-                    "truncated": truncated,
-                    "multiple_matches": len(files) > 1,
-                    "match_count": len(files),
-                    "file_type": "pdf",
-                    "page_count": len(pdf.pages),
+                    "ok": False,
+                    "error": f"Could not extract text from PDF. It may be image-based or encrypted.",
                 }
+
+            return {
+                "ok": True,
+                "query": name,
+                "file_path": file_path,
+                "file_size": file_size,
+                "match_score": match_score,
+                "content_preview": content,
+                "truncated": truncated,
+                "multiple_matches": len(files) > 1,
+                "match_count": len(files),
+                "file_type": "pdf",
+                "page_count": page_count,
+            }
         except Exception as e:
             return {"ok": False, "error": f"Error reading PDF: {e}"}
 
-    if file_ext and file_ext not in text_extensions:
+    # Check if it's a readable text file by extension
+    if file_ext and file_ext not in _TEXT_EXTS:
         return {
             "ok": False,
             "error": f"File type '{file_ext}' may not be a text file. File: {file_path}",
         }
 
-    # Read the file content
+    # Read the file content (only the first max_bytes, whatever the file size)
     try:
-        p = Path(file_path)
-        if not p.exists():
-            return {"ok": False, "error": f"File not found: {file_path}"}
-
-        file_size = p.stat().st_size
-        data = p.read_bytes()
-
-        # Limit to max_bytes
-        snippet = data[:max_bytes]
-        truncated = len(data) > max_bytes
+        snippet, file_size = _read_head(file_path, max_bytes)
+        truncated = file_size > len(snippet)
 
         try:
             content = snippet.decode("utf-8", errors="replace")
@@ -718,6 +1340,13 @@ def summarize_file(name: str, max_bytes: int = 10000) -> Dict[str, Any]:
         return {"ok": False, "error": f"Error reading file: {e}"}
 
 
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
 def list_directory(
     path: str = ".", show_hidden: bool = False, pattern: str = None
 ) -> Dict[str, Any]:
@@ -734,30 +1363,34 @@ def list_directory(
             return {"ok": False, "error": f"Path is not a directory: {path}"}
 
         items = []
-
-        for item in sorted(p.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-            # Skip hidden files unless requested
-            if not show_hidden and item.name.startswith("."):
-                continue
-
-            # Apply pattern filter if provided
-            if pattern:
-                import fnmatch
-
-                if not fnmatch.fnmatch(item.name, pattern):
-                    continue
-
+        # Compile the glob once rather than per entry
+        matches = _glob_matcher(pattern) if pattern else None
+
+        # scandir reports each entry's type from the directory read itself,
+        # so the only syscall per listed entry is the one stat() below
+        with os.scandir(p) as it:
+            entries = [
+                entry
+                for entry in it
+                # Skip hidden files unless requested
+                if (show_hidden or not entry.name.startswith("."))
+                # Apply pattern filter if provided
+                and (not matches or matches(entry.name))
+            ]
+        entries.sort(key=lambda e: (not _entry_is_dir(e), e.name.lower()))
+
+        for entry in entries:
             try:
-                stat = item.stat()
-                is_dir = item.is_dir()
+                st = entry.stat()
+                is_dir = _entry_is_dir(entry)
 
                 items.append(
                     {
-                        "name": item.name,
+                        "name": entry.name,
                         "is_dir": is_dir,
-                        "size": stat.st_size if not is_dir else None,
-                        "modified": stat.st_mtime,
-                        "path": str(item),
+                        "size": st.st_size if not is_dir else None,
+                        "modified": st.st_mtime,
+                        "path": entry.path,
                     }
                 )
             except (PermissionError, OSError):
@@ -775,6 +1408,95 @@ def list_directory(
         return {"ok": False, "error": f"Error listing directory: {e}"}
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> re.Pattern:
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _glob_matcher(pattern: str) -> Callable[[str], bool]:
+    """Case-sensitive fnmatch for `pattern`, compiled to a regex once."""
+    match = _compile_glob(pattern).match
+    return lambda name: match(name) is not None
+
+
+def _file_pattern_matcher(base: Path, pattern: str) -> Callable[[os.DirEntry], bool]:
+    """Matches the same entries as Path.glob(f"**/{pattern}") under `base`."""
+    if "/" not in pattern:
+        by_name = _compile_glob(pattern).match
+        return lambda entry: by_name(entry.name) is not None
+
+    # Patterns with a directory part are matched component by component
+    # against the path relative to base, one compiled glob per component
+    # ("*" never crosses a "/"). None stands for "**", which matches zero
+    # or more directories; the implicit leading "**/" is the first one.
+    segments: List[Callable | None] = [None]
+    for seg in pattern.strip("/").split("/"):
+        if seg != "**":
+            segments.append(_compile_glob(seg).match)
+        elif segments[-1] is not None:
+            segments.append(None)
+    # Entries from _walk_scandir(base) all start with this prefix, so
+    # slicing it off is the relative path without an os.path.relpath call
+    prefix_len = len(os.path.join(os.fspath(base), ""))
+
+    def with_skips(states: set[int]) -> set[int]:
+        # A "**" may match nothing, so being before it is also being after it
+        out = set(states)
+        for i in states:
+            while i < len(segments) and segments[i] is None:
+                i += 1
+                out.add(i)
+        return out
+
+    def matches(entry: os.DirEntry) -> bool:
+        # States are indexes into segments: "the next segment to match"
+        states = {0}
+        for part in entry.path[prefix_len:].split("/"):
+            states = {
+                i if segments[i] is None else i + 1
+                for i in with_skips(states)
+                if i < len(segments)
+                and (segments[i] is None or segments[i](part) is not None)
+            }
+            if not states:
+                return False
+        return len(segments) in with_skips(states)
+
+    return matches
+
+
+# Files at least this big are checked for a match via mmap before being read
+MMAP_SEARCH_MIN_BYTES = 64 * 1024
+
+
+def _grep(
+    text: AnyStr, haystack: AnyStr, needle: AnyStr
+) -> Iterator[tuple[int, AnyStr]]:
+    """
+    Yield (line_number, line) for each line of `text` containing `needle`.
+
+    `haystack` is `text` as it should be searched (e.g. lowercased, same
+    length). The search jumps from hit to hit with find() and counts
+    newlines in between, so lines without a match are never split out or
+    copied.
+    """
+    newline = b"\n" if isinstance(text, bytes) else "\n"
+    line_num, counted_to = 1, 0
+    pos = haystack.find(needle)
+    while pos != -1 and pos < len(text):
+        line_num += text.count(newline, counted_to, pos)
+        counted_to = pos
+        start = text.rfind(newline, 0, pos) + 1
+        end = text.find(newline, pos)
+        if end == -1:
+            end = len(text)
+        yield line_num, text[start:end]
+        if end >= len(text):
+            break
+        # At most one hit per line
+        pos = haystack.find(needle, end + 1)
+
+
 def search_content(
     query: str,
     path: str = ".",
@@ -795,39 +1517,89 @@ def search_content(
             return {"ok": False, "error": f"Path is not a directory: {path}"}
 
         results = []
-        search_query = query if case_sensitive else query.lower()
+        # bytes.lower() only folds ASCII, so non-ASCII queries are matched
+        # case-insensitively on decoded text instead
+        as_bytes = case_sensitive or query.isascii()
+        if as_bytes:
+            needle = query.encode("utf-8")
+            if not case_sensitive:
+                needle = needle.lower()
+        else:
+            needle = query.lower()
+        # Used to rule out large files without reading them into memory
+        probe = (
+            re.compile(re.escape(needle), 0 if case_sensitive else re.IGNORECASE)
+            if as_bytes
+            else None
+        )
 
-        # Determine glob pattern
-        glob_pattern = "**/*" if not file_pattern else f"**/{file_pattern}"
+        matches = _file_pattern_matcher(p, file_pattern) if file_pattern else None
 
-        for file_path in p.glob(glob_pattern):
-            if not file_path.is_file():
+        for entry in _walk_scandir(p):
+            if matches and not matches(entry):
                 continue
+            # Without an explicit pattern, don't bother opening binary types
+            if not matches:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext and ext not in _TEXT_EXTS:
+                    continue
 
             # Skip binary files and very large files
             try:
-                if file_path.stat().st_size > 10_000_000:  # Skip files > 10MB
+                if not entry.is_file():
+                    continue
+                size = entry.stat().st_size
+                if size > 10_000_000:  # Skip files > 10MB
+                    continue
+
+                with open(entry.path, "rb") as f:
+                    if probe is not None and size > MMAP_SEARCH_MIN_BYTES:
+                        # Scan the page cache in place; only files that
+                        # actually contain the query get read
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if probe.search(mm) is None:
+                                continue
+                    data = f.read()
+
+                # A NUL byte near the start means binary; nothing useful to show
+                if b"\0" in data[:4096]:
                     continue
 
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    for line_num, line in enumerate(f, 1):
-                        check_line = line if case_sensitive else line.lower()
-
-                        if search_query in check_line:
-                            results.append(
-                                {
-                                    "file": str(
-                                        file_path.relative_to(p)
-                                        if file_path.is_relative_to(p)
-                                        else file_path
-                                    ),
-                                    "line_number": line_num,
-                                    "line_content": line.rstrip(),
-                                }
-                            )
-
-                            if len(results) >= max_results:
-                                break
+                if as_bytes:
+                    text = data
+                    haystack = data if case_sensitive else data.lower()
+                else:
+                    text = data.decode("utf-8", errors="ignore")
+                    haystack = text.lower()
+                    if len(haystack) != len(text):
+                        # A few characters change length when lowercased;
+                        # fall back to searching line by line
+                        text = haystack = None
+
+                if text is None:
+                    hits = (
+                        (n, line)
+                        for n, line in enumerate(
+                            data.decode("utf-8", errors="ignore").splitlines(), 1
+                        )
+                        if needle in line.lower()
+                    )
+                else:
+                    hits = _grep(text, haystack, needle)
+
+                for line_num, line in hits:
+                    if isinstance(line, bytes):
+                        line = line.decode("utf-8", errors="ignore")
+                    results.append(
+                        {
+                            "file": os.path.relpath(entry.path, p),
+                            "line_number": line_num,
+                            "line_content": line.rstrip(),
+                        }
+                    )
+
+                    if len(results) >= max_results:
+                        break
 
                 if len(results) >= max_results:
                     break
@@ -849,62 +1621,112 @@ def search_content(
         return {"ok": False, "error": f"Error searching content: {e}"}
 
 
-def get_file_info(path: str) -> Dict[str, Any]:
+# Friendly names for get_file_info's "type" field
+_FILE_TYPES = {
+    ".py": "Python script",
+    ".js": "JavaScript file",
+    ".txt": "Text file",
+    ".md": "Markdown file",
+    ".json": "JSON file",
+    ".pdf": "PDF document",
+    ".zip": "ZIP archive",
+    ".tar": "TAR archive",
+    ".gz": "GZIP archive",
+}
+
+
+# The three timestamps of a file are often the same second, and files
+# inspected together tend to share them too
+@functools.lru_cache(maxsize=256)
+def _format_time(seconds: int) -> str:
+    # Same text as strftime("%Y-%m-%d %H:%M:%S"), without the locale machinery
+    return datetime.fromtimestamp(seconds).isoformat(sep=" ", timespec="seconds")
+
+
+def _file_info(p: Path, st: os.stat_result) -> Dict[str, Any]:
+    is_dir = stat.S_ISDIR(st.st_mode)
+
+    # Determine file type
+    if is_dir:
+        file_type = "directory"
+    else:
+        suffix = p.suffix.lower()
+        file_type = _FILE_TYPES.get(
+            suffix, f"{suffix[1:].upper()} file" if suffix else "Unknown"
+        )
+
+    return {
+        "path": str(p),
+        "name": p.name,
+        "type": file_type,
+        "is_directory": is_dir,
+        "size": f"{st.st_size:,} bytes",
+        "created": _format_time(int(st.st_ctime)),
+        "modified": _format_time(int(st.st_mtime)),
+        "accessed": _format_time(int(st.st_atime)),
+        "permissions": f"{st.st_mode & 0o777:03o}",
+    }
+
+
+def _bulk_file_info(paths: List[Path]) -> Dict[Path, os.stat_result]:
     """
-    Get detailed metadata about a file.
+    Stat many paths, opening each parent directory once and stat'ing its
+    files relative to that fd, so the kernel resolves a shared parent
+    path once rather than once per file. Paths that can't be stat'ed are
+    left out of the result.
     """
-    try:
-        p = _normalize_path(path)
+    by_parent: Dict[Path, List[Path]] = {}
+    for p in paths:
+        by_parent.setdefault(p.parent, []).append(p)
 
-        if not p.exists():
-            return {"ok": False, "error": f"File not found: {path}"}
+    stats: Dict[Path, os.stat_result] = {}
+    for parent, group in by_parent.items():
+        try:
+            dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+        except OSError:
+            dir_fd = None
+        try:
+            for p in group:
+                try:
+                    if dir_fd is not None and p.name:
+                        stats[p] = os.stat(p.name, dir_fd=dir_fd)
+                    else:
+                        stats[p] = os.stat(p)
+                except OSError:
+                    continue
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    return stats
 
-        stat = p.stat()
-        is_dir = p.is_dir()
 
-        # Determine file type
-        if is_dir:
-            file_type = "directory"
-        else:
-            suffix = p.suffix.lower()
-            type_map = {
-                ".py": "Python script",
-                ".js": "JavaScript file",
-                ".txt": "Text file",
-                ".md": "Markdown file",
-                ".json": "JSON file",
-                ".pdf": "PDF document",
-                ".zip": "ZIP archive",
-                ".tar": "TAR archive",
-                ".gz": "GZIP archive",
+def get_file_info(path: str | List[str]) -> Dict[str, Any]:
+    """
+    Get detailed metadata about a file, or about each file in a list.
+    """
+    try:
+        if not isinstance(path, str):
+            paths = [_normalize_path(str(item)) for item in path]
+            stats = _bulk_file_info(paths)
+            return {
+                "ok": True,
+                "files": [_file_info(p, stats[p]) for p in paths if p in stats],
+                "missing": [
+                    str(item) for item, p in zip(path, paths) if p not in stats
+                ],
             }
-            file_type = type_map.get(
-                suffix, f"{suffix[1:].upper()} file" if suffix else "Unknown"
-            )
 
-        import time
+        p = _normalize_path(path)
 
-        file_info = {
-            "path": str(p),
-            "name": p.name,
-            "type": file_type,
-            "is_directory": is_dir,
-            "size": f"{stat.st_size:,} bytes",
-            "created": time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_ctime)
-            ),
-            "modified": time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)
-            ),
-            "accessed": time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_atime)
-            ),
-            "permissions": oct(stat.st_mode)[-3:],
-        }
+        # One stat for everything; exists()/is_dir()/stat() would be three
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            return {"ok": False, "error": f"File not found: {path}"}
 
         return {
             "ok": True,
-            "file_info": file_info,
+            "file_info": _file_info(p, st),
         }
 
     except Exception as e:
@@ -915,9 +1737,8 @@ def copy_file(source: str, destination: str) -> Dict[str, Any]:
     """
     Copy a file from source to destination.
     """
+    _invalidate_find_cache()
     try:
-        import shutil
-
         src = _normalize_path(source)
         dst = _normalize_path(destination)
 
@@ -945,7 +1766,7 @@ def copy_file(source: str, destination: str) -> Dict[str, Any]:
         dst.parent.mkdir(parents=True, exist_ok=True)
 
         # Copy the file
-        shutil.copy2(src, dst)
+        _fastcopy(src, dst)
 
         return {
             "ok": True,
@@ -963,30 +1784,39 @@ def move_file(source: str, destination: str) -> Dict[str, Any]:
     """
     Move or rename a file.
     """
+    _invalidate_find_cache()
     try:
-        import shutil
-
         src = _normalize_path(source)
         dst = _normalize_path(destination)
 
-        if not src.exists():
+        try:
+            src_mode = os.stat(src).st_mode
+        except FileNotFoundError:
             return {"ok": False, "error": f"Source file not found: {source}"}
 
-        if src.is_dir():
+        if stat.S_ISDIR(src_mode):
             return {
                 "ok": False,
                 "error": f"Source is a directory, not a file: {source}",
             }
 
         # If destination is a directory, use source filename
-        if dst.exists() and dst.is_dir():
+        if dst.is_dir():
             dst = dst / src.name
 
         # Create parent directory if needed
         dst.parent.mkdir(parents=True, exist_ok=True)
 
-        # Move the file
-        shutil.move(str(src), str(dst))
+        # Same filesystem: a single rename. shutil.move would probe the
+        # paths with several extra stats before getting to the same call.
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Across filesystems shutil.move copies then unlinks; let it
+            # use our kernel-side copy instead of copy2
+            shutil.move(src, dst, copy_function=_fastcopy)
 
         return {
             "ok": True,
@@ -1000,13 +1830,208 @@ def move_file(source: str, destination: str) -> Dict[str, Any]:
         return {"ok": False, "error": f"Error moving file: {e}"}
 
 
+_NO_EOL_MARKER = b"\n\\ No newline at end of file"
+
+
+class _MappedLines:
+    """
+    A file's lines, mmap'd and sliced out on demand, without line endings.
+    An unterminated last line carries _NO_EOL_MARKER instead.
+
+    Only the newline offsets live on the Python heap (8 bytes per line), so
+    diffing large files doesn't hold two full lists of str objects.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap can't map an empty file
+            self._data = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            )
+
+        ends = array("Q")
+        find = self._data.find
+        pos = find(b"\n")
+        while pos != -1:
+            ends.append(pos)
+            pos = find(b"\n", pos + 1)
+        # Last line has no trailing newline
+        self._unterminated = bool(size) and (not ends or ends[-1] != size - 1)
+        if self._unterminated:
+            ends.append(size)
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def _line(self, i: int) -> bytes:
+        start = self._ends[i - 1] + 1 if i else 0
+        line = self._data[start : self._ends[i]]
+        if self._unterminated and i == len(self._ends) - 1:
+            # Compares unequal to the same text with a newline, and prints
+            # GNU diff's marker under the line ("\n" can't occur inside one)
+            return line + _NO_EOL_MARKER
+        # Match text-mode reads, where "\r\n" comes back as "\n"
+        return line[:-1] if line[-1:] == b"\r" else line
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._line(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self._line(index)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return map(self._line, range(len(self)))
+
+    def is_utf8(self) -> bool:
+        # Chunked so validating a large file never decodes it all at once
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            for start in range(0, len(self._data), _COPY_BUFSIZE):
+                decoder.decode(self._data[start : start + _COPY_BUFSIZE])
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+# One code point per distinct line, so diff_match_patch diffs lines not chars
+_MAX_DIFF_LINES = 0x10FFFF
+
+
+def _line_opcodes(a: Sequence[bytes], b: Sequence[bytes]) -> List[tuple] | None:
+    """
+    Line-level opcodes for a -> b from diff_match_patch's Myers diff, in
+    the same (tag, i1, i2, j1, j2) shape as SequenceMatcher.get_opcodes().
+
+    Returns None when the files have too many distinct lines to encode.
+    """
+    codes: Dict[bytes, str] = {}
+    encoded = []
+    for lines in (a, b):
+        chars = []
+        for line in lines:
+            c = codes.get(line)
+            if c is None:
+                if len(codes) >= _MAX_DIFF_LINES:
+                    return None
+                c = codes[line] = chr(len(codes) + 1)
+            chars.append(c)
+        encoded.append("".join(chars))
+
+    dmp = _DiffMatchPatch()
+    opcodes = []
+    i = j = 0
+    for op, chars in dmp.diff_main(encoded[0], encoded[1], False):
+        n = len(chars)
+        if op == dmp.DIFF_EQUAL:
+            opcodes.append(("equal", i, i + n, j, j + n))
+            i += n
+            j += n
+        elif op == dmp.DIFF_DELETE:
+            opcodes.append(("delete", i, i + n, j, j))
+            i += n
+        else:
+            opcodes.append(("insert", i, i, j, j + n))
+            j += n
+    return opcodes
+
+
+def _grouped_opcodes(codes: List[tuple], n: int) -> Iterator[List[tuple]]:
+    # Same hunk grouping as SequenceMatcher.get_grouped_opcodes()
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    # Unified diff "start,length" range, 1-based; empty ranges name the line before
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        start -= 1
+    return f"{start + 1},{length}"
+
+
+def _write_lines(out: bytearray, prefix: bytes, lines: List[bytes]) -> None:
+    # One join per run of lines rather than three appends per line
+    if lines:
+        out += prefix
+        out += (b"\n" + prefix).join(lines)
+        out += b"\n"
+
+
+def _write_unified_diff(
+    out: bytearray,
+    a: Sequence[bytes],
+    b: Sequence[bytes],
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+) -> int:
+    """
+    Append what difflib.unified_diff(..., lineterm="") would produce for
+    a -> b to `out`, as UTF-8 bytes with a newline after every line, and
+    return the number of changed (+/-) lines.
+
+    diff_match_patch does the line matching when installed:
+    SequenceMatcher goes quadratic on large, repetitive files; Myers
+    stays O(ND). Lines stay bytes until the caller decodes `out` once.
+    """
+    opcodes = _line_opcodes(a, b) if HAS_DIFF_MATCH_PATCH else None
+    if opcodes is None:
+        opcodes = SequenceMatcher(None, a, b).get_opcodes()
+
+    changes = 0
+    for group in _grouped_opcodes(opcodes, n):
+        if not changes:
+            out += f"--- {fromfile}\n+++ {tofile}\n".encode("utf-8", "surrogateescape")
+        first, last = group[0], group[-1]
+        out += (
+            f"@@ -{_format_range(first[1], last[2])}"
+            f" +{_format_range(first[3], last[4])} @@\n"
+        ).encode()
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                _write_lines(out, b" ", a[i1:i2])
+                continue
+            # Counted from the opcodes, so no per-line prefix test
+            changes += (i2 - i1) + (j2 - j1)
+            _write_lines(out, b"-", a[i1:i2])
+            _write_lines(out, b"+", b[j1:j2])
+    return changes
+
+
 def compare_files(file1: str, file2: str, context_lines: int = 3) -> Dict[str, Any]:
     """
     Compare two files and show differences.
     """
     try:
-        import difflib
-
         f1 = _normalize_path(file1)
         f2 = _normalize_path(file2)
 
@@ -1016,38 +2041,49 @@ def compare_files(file1: str, file2: str, context_lines: int = 3) -> Dict[str, A
         if not f2.exists():
             return {"ok": False, "error": f"Second file not found: {file2}"}
 
-        # Read both files
-        try:
-            with open(f1, "r", encoding="utf-8") as file:
-                lines1 = file.readlines()
-        except UnicodeDecodeError:
-            return {"ok": False, "error": f"Cannot read {file1} as text (binary file?)"}
+        # Byte-identical files (a file vs. its untouched copy) need no diff.
+        # filecmp checks sizes first and stops at the first differing chunk.
+        if filecmp.cmp(f1, f2, shallow=False):
+            return {
+                "ok": True,
+                "file1": str(f1),
+                "file2": str(f2),
+                "identical": True,
+                "diff": "Files are identical",
+            }
 
+        lines1 = _MappedLines(f1)
+        lines2 = _MappedLines(f2)
         try:
-            with open(f2, "r", encoding="utf-8") as file:
-                lines2 = file.readlines()
-        except UnicodeDecodeError:
-            return {"ok": False, "error": f"Cannot read {file2} as text (binary file?)"}
-
-        # Generate unified diff
-        diff = difflib.unified_diff(
-            lines1,
-            lines2,
-            fromfile=str(f1),
-            tofile=str(f2),
-            lineterm="",
-            n=context_lines,
-        )
+            if not lines1.is_utf8():
+                return {
+                    "ok": False,
+                    "error": f"Cannot read {file1} as text (binary file?)",
+                }
+            if not lines2.is_utf8():
+                return {
+                    "ok": False,
+                    "error": f"Cannot read {file2} as text (binary file?)",
+                }
 
-        diff_lines = list(diff)
+            diff = bytearray()
+            changes = _write_unified_diff(
+                diff, lines1, lines2, str(f1), str(f2), n=context_lines
+            )
+        finally:
+            lines1.close()
+            lines2.close()
 
-        if not diff_lines:
+        if not changes:
+            # filecmp already saw different bytes, so only the line endings
+            # ("\r\n" vs "\n") differ; never call the files identical
             return {
                 "ok": True,
                 "file1": str(f1),
                 "file2": str(f2),
-                "identical": True,
-                "diff": "Files are identical",
+                "identical": False,
+                "diff": "Files differ only in line endings",
+                "changes": 0,
             }
 
         return {
@@ -1055,24 +2091,60 @@ def compare_files(file1: str, file2: str, context_lines: int = 3) -> Dict[str, A
             "file1": str(f1),
             "file2": str(f2),
             "identical": False,
-            "diff": "\n".join(diff_lines),
-            "changes": len(
-                [l for l in diff_lines if l.startswith("+") or l.startswith("-")]
-            ),
+            "diff": diff.decode("utf-8", "replace").removesuffix("\n"),
+            "changes": changes,
         }
 
     except Exception as e:
         return {"ok": False, "error": f"Error comparing files: {e}"}
 
 
+# extract_archive reports only the first few names, plus a total
+_SHOWN_ARCHIVE_NAMES = 20
+
+
+def _extract_zip(arc: Path, dest: Path) -> tuple[List[str], int]:
+    with zipfile.ZipFile(arc, "r") as zip_ref:
+        infos = zip_ref.infolist()
+        zip_ref.extractall(dest, infos)
+    names = [info.filename for info in islice(infos, _SHOWN_ARCHIVE_NAMES)]
+    return names, len(infos)
+
+
+def _extract_tar(arc: Path, dest: Path) -> tuple[List[str], int]:
+    names = []
+    total = 0
+
+    def members(tar_ref):
+        # Iterating the TarFile reads headers as it goes, so a compressed
+        # tar is decompressed once, front to back, while we extract
+        nonlocal total
+        for member in tar_ref:
+            total += 1
+            if len(names) < _SHOWN_ARCHIVE_NAMES:
+                names.append(member.name)
+            yield member
+
+    with tarfile.open(arc, "r:*") as tar_ref:
+        tar_ref.extractall(dest, members=members(tar_ref))
+    return names, total
+
+
+# Keyed by the last suffix, so "x.tar.gz" goes through ".gz"
+_ARCHIVE_HANDLERS: Dict[str, Callable[[Path, Path], tuple[List[str], int]]] = {
+    ".zip": _extract_zip,
+    ".tar": _extract_tar,
+    ".gz": _extract_tar,
+    ".tgz": _extract_tar,
+}
+
+
 def extract_archive(archive_path: str, destination: str = None) -> Dict[str, Any]:
     """
     Extract compressed archive files.
     """
+    _invalidate_find_cache()
     try:
-        import zipfile
-        import tarfile
-
         arc = _normalize_path(archive_path)
 
         if not arc.exists():
@@ -1086,33 +2158,21 @@ def extract_archive(archive_path: str, destination: str = None) -> Dict[str, Any
 
         dest.mkdir(parents=True, exist_ok=True)
 
-        extracted_files = []
-
-        # Detect archive type and extract
-        if arc.suffix.lower() == ".zip":
-            with zipfile.ZipFile(arc, "r") as zip_ref:
-                zip_ref.extractall(dest)
-                extracted_files = zip_ref.namelist()
-
-        elif arc.suffix.lower() in [".tar", ".gz", ".tgz"] or arc.name.endswith(
-            ".tar.gz"
-        ):
-            with tarfile.open(arc, "r:*") as tar_ref:
-                tar_ref.extractall(dest)
-                extracted_files = tar_ref.getnames()
-
-        else:
+        extract = _ARCHIVE_HANDLERS.get(arc.suffix.lower())
+        if extract is None:
             return {
                 "ok": False,
                 "error": f"Unsupported archive format: {arc.suffix}. Supported: .zip, .tar, .tar.gz, .tgz",
             }
 
+        extracted_files, total_files = extract(arc, dest)
+
         return {
             "ok": True,
             "archive": str(arc),
             "destination": str(dest),
-            "extracted_files": extracted_files[:20],  # Limit to first 20 for display
-            "total_files": len(extracted_files),
+            "extracted_files": extracted_files,  # First few, for display
+            "total_files": total_files,
         }
 
     except Exception as e:
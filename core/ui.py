@@ -0,0 +1,7 @@
+from rich.console import Console
+
+
+# One console for the whole CLI. Highlighting is off: everything we print is
+# either our own markup or raw file/command text wrapped in rich.text.Text,
+# and running the repr highlighter over large outputs is pure overhead.
+console = Console(highlight=False)
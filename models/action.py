@@ -1,9 +1,11 @@
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Action(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tool: str = Field(..., description="Name of the tool to call, e.g. 'run_shell'")
     args: Dict[str, Any] = Field(
         default_factory=dict,
@@ -1,11 +1,13 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .action import Action
 
 
 class Plan(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     plan: str = Field(
         default="No high-level plan provided.",
         description="Natural language explanation of what the agent will do.",
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses ValueError, like json's
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def _default_cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "terminal-agent" / "llm"
+
+
+class LLMCache:
+    """
+    Exact-match, on-disk cache of LLM responses.
+
+    Each entry is a small JSON file named after the sha256 of the request
+    (model, mode, query, tools summary, rendered system prompt), so editing
+    the prompt invalidates old entries and identical `ask` questions,
+    identical `do` plans and re-summarizing an unchanged file skip the
+    Ollama round-trip entirely.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+
+    @staticmethod
+    def make_key(
+        mode: str,
+        query: str,
+        tools_summary: str | None = None,
+        model: str = "",
+        system_prompt: str = "",
+    ) -> str:
+        prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        payload = json.dumps(
+            {
+                "model": model,
+                "mode": mode,
+                "query": query,
+                "tools": tools_summary,
+                "prompt": prompt_hash,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        try:
+            # Parse the bytes directly; no text-mode decode pass first
+            data = _loads(self._entry_path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        response = data.get("response") if isinstance(data, dict) else None
+        return response if isinstance(response, str) else None
+
+    def set(self, key: str, response: str) -> None:
+        path = self._entry_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump({"response": response}, f)
+            # Atomic so a concurrent reader never sees a half-written entry
+            os.replace(tmp, path)
+        except OSError:
+            # Caching is best effort; never fail the actual request over it
+            tmp.unlink(missing_ok=True)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], str],
+        accept: Callable[[str], bool] | None = None,
+    ) -> str:
+        """
+        Return the cached response for `key`, or compute and store it.
+
+        `accept` lets the caller veto a response (e.g. a plan that doesn't
+        parse): rejected responses are returned but never stored, and a
+        rejected cached entry is recomputed instead of being served.
+        """
+        cached = self.get(key)
+        if cached is not None and (accept is None or accept(cached)):
+            return cached
+        response = compute()
+        # Don't pin empty answers; they are usually a transient model hiccup
+        if response and (accept is None or accept(response)):
+            self.set(key, response)
+        return response
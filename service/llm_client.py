@@ -1,10 +1,22 @@
 import os
 import json
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from service.llm_cache import LLMCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 @lru_cache(maxsize=1)
@@ -82,53 +94,230 @@ def _load_prompt_sections() -> Dict[str, str]:
     return sections
 
 
+@lru_cache(maxsize=8)
+def _system_prompt(mode: str, tools_summary: str | None) -> str:
+    """
+    The final system prompt for a mode. The tool specs are the same
+    string on every call, so the {{TOOLS}} substitution is done once.
+    """
+    sections = _load_prompt_sections()
+
+    if mode == "action":
+        return sections["ACTION"].replace("{{TOOLS}}", tools_summary or "")
+    return sections["CHAT"]
+
+
+class _JsonObjectEnd:
+    """
+    Watches streamed text for the end of the first top-level JSON object,
+    so an action call can hang up as soon as the plan is complete instead
+    of waiting out whatever the model adds after it.
+
+    Only replies that open with the JSON (bare or in a ``` fence) are
+    tracked; prose first means braces can't be trusted, so feed() then
+    never reports an end.
+    """
+
+    def __init__(self) -> None:
+        self.watching: bool | None = None
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int | None:
+        """
+        Scan the next piece of the reply. Returns the offset in `text` just
+        past the brace that closes the object, or None if it hasn't closed.
+        """
+        for i, ch in enumerate(text):
+            if self.watching is None:
+                if ch.isspace():
+                    continue
+                self.watching = ch in "{`"
+            if not self.watching:
+                return None
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return i + 1
+        return None
+
+
+class ModelNotFoundError(RuntimeError):
+    """The configured model isn't pulled in the Ollama instance."""
+
+
 class LLMClient:
     def __init__(
         self,
         base_url: str | None = None,
         model: str | None = None,
         timeout: int = 60,
+        cache: LLMCache | None = None,
+        keep_alive: str | None = None,
     ) -> None:
         self.base_url = base_url or os.getenv(
             "OLLAMA_BASE_URL", "http://localhost:11434"
         )
         self.model = model or os.getenv("TERMINAL_AGENT_MODEL", "llama3.2")
         self.timeout = timeout
+        self.cache = cache
+        # How long Ollama keeps the model (and the KV cache of our fixed
+        # system prompt) loaded after a request. Only sent when configured;
+        # otherwise the server's own default (5m) applies, since holding
+        # the model's memory longer is the user's call, not ours.
+        self.keep_alive = (
+            keep_alive
+            or os.getenv("TERMINAL_AGENT_KEEP_ALIVE")
+            or os.getenv("OLLAMA_KEEP_ALIVE")
+        )
 
-    def _post_chat(self, messages: List[Dict[str, str]]) -> str:
+        # One pooled keep-alive connection for every call this client makes,
+        # instead of a fresh TCP connection per requests.post(). Retries only
+        # cover failed connects (e.g. Ollama still starting up): urllib3
+        # never re-sends a POST that reached the server.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Open the pooled connection and learn the installed models in the
+        # background while the CLI gets on with parsing/routing. None means
+        # "unknown" (not fetched, or the server didn't answer /api/tags).
+        self._known_models: frozenset[str] | None = None
+        self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+        self._warmup_thread.start()
+
+    def _warmup(self) -> None:
+        try:
+            resp = self._session.get(f"{self.base_url}/api/tags", timeout=2)
+            resp.raise_for_status()
+            models = _loads(resp.content).get("models", [])
+        except Exception:  # noqa: BLE001
+            # Connection problems are reported by the real request
+            return
+        self._known_models = frozenset(
+            name for m in models for name in (m.get("name"), m.get("model")) if name
+        )
+
+    def _check_model(self) -> None:
+        """
+        Fail fast on a model Ollama doesn't have, instead of after a full
+        round trip. Waits briefly for the warm-up; if it hasn't answered,
+        the request just goes ahead.
+        """
+        self._warmup_thread.join(timeout=2)
+        known = self._known_models
+        if known is None:
+            return
+        # "llama3.2" is stored as "llama3.2:latest"
+        if self.model in known or f"{self.model}:latest" in known:
+            return
+        raise ModelNotFoundError(
+            f"Model '{self.model}' not found in Ollama at {self.base_url}. "
+            f"Pull it with: ollama pull {self.model}"
+        )
+
+    def _post_chat(
+        self, messages: List[Dict[str, str]], stop_after_json: bool = False
+    ) -> str:
+        """
+        Stream the reply as NDJSON chunks and join their content. With
+        stop_after_json, the stream is closed once the first JSON object
+        is complete, which also stops Ollama generating the rest.
+        """
         url = f"{self.base_url}/api/chat"
         payload = {
             "model": self.model,
             "messages": messages,
-            "stream": False,
+            "stream": True,
         }
-        resp = requests.post(url, json=payload, timeout=self.timeout)
-        resp.raise_for_status()
-        data = resp.json()
-        content = data.get("message", {}).get("content", "")
-        return content
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        json_end = _JsonObjectEnd() if stop_after_json else None
+        parts: list[str] = []
+
+        with self._session.post(
+            url, json=payload, stream=True, timeout=self.timeout
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = _loads(line)
+                if "error" in chunk:
+                    # Errors after the 200 arrive in-band
+                    raise requests.HTTPError(chunk["error"], response=resp)
+
+                content = chunk.get("message", {}).get("content", "")
+                end = json_end.feed(content) if json_end else None
+                if end is not None:
+                    # Drop whatever the model started writing after the JSON
+                    parts.append(content[:end])
+                    break
+                parts.append(content)
+                if chunk.get("done"):
+                    break
+
+        return "".join(parts)
 
     def chat(
-        self, user_query: str, mode: str = "chat", tools_summary: str | None = None
+        self,
+        user_query: str,
+        mode: str = "chat",
+        tools_summary: str | None = None,
+        accept: Callable[[str], bool] | None = None,
     ) -> str:
         """
         mode = 'chat' | 'action'
         If mode == 'action', we instruct model to output ONLY JSON.
+        If a cache is attached, identical requests are answered from it;
+        `accept` decides whether a reply is good enough to cache.
         """
-        sections = _load_prompt_sections()
+        if self.cache is None:
+            return self._chat_uncached(user_query, mode, tools_summary)
 
-        if mode == "action":
-            system_prompt = sections["ACTION"]
-            if tools_summary:
-                system_prompt = system_prompt.replace("{{TOOLS}}", tools_summary)
-            else:
-                system_prompt = system_prompt.replace("{{TOOLS}}", "")
-        else:
-            system_prompt = sections["CHAT"]
+        key = self.cache.make_key(
+            mode,
+            user_query,
+            tools_summary,
+            model=self.model,
+            system_prompt=_system_prompt(mode, tools_summary),
+        )
+        return self.cache.get_or_compute(
+            key,
+            lambda: self._chat_uncached(user_query, mode, tools_summary),
+            accept=accept,
+        )
+
+    def _chat_uncached(
+        self, user_query: str, mode: str, tools_summary: str | None
+    ) -> str:
+        self._check_model()
+        system_prompt = _system_prompt(mode, tools_summary)
 
+        # The system prompt (including the tool specs) is identical on every
+        # call, so keep it first and the per-request query last: Ollama can
+        # then reuse the already-evaluated prefix instead of re-reading it.
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_query},
         ]
 
-        return self._post_chat(messages)
+        return self._post_chat(messages, stop_after_json=mode == "action")
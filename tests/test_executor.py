@@ -0,0 +1,32 @@
+from rich.console import Console
+
+from core.executor import _args_preview
+from models import Action
+
+
+def _render(action):
+    console = Console(width=400, record=True)
+    console.print(_args_preview(action))
+    return console.export_text()
+
+
+def test_paths_are_never_shortened():
+    source = "/home/user/" + "deeply/nested/" * 20 + "report.txt"
+    paths = [f"file{i}.txt" for i in range(12)]
+
+    move = _render(
+        Action(tool="move_file", args={"source": source, "destination": "."})
+    )
+    info = _render(Action(tool="get_file_info", args={"path": paths}))
+
+    assert source in move
+    assert all(p in info for p in paths)
+
+
+def test_write_file_content_is_summarized():
+    action = Action(
+        tool="write_file", args={"path": "notes.txt", "content": "x" * 10_000}
+    )
+    text = _render(action)
+    assert "<10000 bytes>" in text
+    assert "x" * 200 not in text
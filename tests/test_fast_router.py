@@ -0,0 +1,47 @@
+import pytest
+
+from core.fast_router import try_route
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "open https://example.com",
+        "open report.pdf",
+        "read https://example.com/notes.txt",
+        "find it",
+        "find the file",
+        "find duplicates",
+        "find everything",
+        "summarize it",
+        "summarize the file",
+        "summarise this",
+        "show me the contents of notes.md",
+        "show the contents of config.json",
+        "list contents of src/main.py",
+        "show report.pdf",
+        "display photo.png",
+    ],
+)
+def test_vague_queries_fall_through_to_planner(query):
+    assert try_route(query) is None
+
+
+@pytest.mark.parametrize(
+    "query, tool, args",
+    [
+        ("list files in ~/Downloads", "list_directory", {"path": "~/Downloads"}),
+        ("show contents of src", "list_directory", {"path": "src"}),
+        ("list the v1.2 folder", "list_directory", {"path": "v1.2"}),
+        ("read notes.md", "read_file", {"path": "notes.md"}),
+        ("show me config.json", "read_file", {"path": "config.json"}),
+        ("find report.pdf", "find_item", {"name": "report.pdf"}),
+        ("find the folder ./build", "find_item", {"name": "./build"}),
+        ("summarize src/main.py", "summarize_file", {"name": "src/main.py"}),
+    ],
+)
+def test_simple_queries_are_routed(query, tool, args):
+    plan = try_route(query)
+    assert plan is not None
+    assert plan.actions[0].tool == tool
+    assert plan.actions[0].args == args
@@ -0,0 +1,49 @@
+from core.planner import get_action_plan
+from service.llm_cache import LLMCache
+from service.llm_client import LLMClient
+
+PLAN = '{"plan": "List files.", "actions": [{"tool": "list_directory"}]}'
+
+
+class _CountingClient(LLMClient):
+    def __init__(self, cache, replies):
+        self.model = "test-model"
+        self.cache = cache
+        self.replies = list(replies)
+        self.calls = 0
+
+    def _chat_uncached(self, user_query, mode, tools_summary):
+        self.calls += 1
+        return self.replies.pop(0)
+
+
+def test_unparseable_plan_is_not_cached(tmp_path):
+    llm = _CountingClient(LLMCache(tmp_path), ["Sure! Here is a plan:", PLAN])
+
+    assert get_action_plan(llm, "list files", "tools") is None
+    assert list(tmp_path.iterdir()) == []
+
+    plan = get_action_plan(llm, "list files", "tools")
+    assert plan is not None and plan.actions[0].tool == "list_directory"
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # The valid plan is now served from the cache
+    assert get_action_plan(llm, "list files", "tools") is not None
+    assert llm.calls == 2
+
+
+def test_rejected_cache_entry_is_recomputed(tmp_path):
+    cache = LLMCache(tmp_path)
+    cache.set("k", "stale")
+
+    result = cache.get_or_compute("k", lambda: "fresh", accept=lambda r: r != "stale")
+
+    assert result == "fresh"
+    assert cache.get("k") == "fresh"
+
+
+def test_key_changes_with_system_prompt():
+    a = LLMCache.make_key("action", "list files", "tools", "m", system_prompt="v1")
+    b = LLMCache.make_key("action", "list files", "tools", "m", system_prompt="v2")
+    assert a != b
+    assert a == LLMCache.make_key("action", "list files", "tools", "m", "v1")
@@ -0,0 +1,123 @@
+import json
+import sys
+
+import pytest
+
+import agent_cli
+from core.planner import get_action_plan
+from service.llm_client import LLMClient, _JsonObjectEnd
+
+
+class _FakeResponse:
+    def __init__(self, chunks):
+        self._lines = [
+            json.dumps({"message": {"content": c}, "done": False}).encode()
+            for c in chunks
+        ]
+        self.lines_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self._lines:
+            self.lines_read += 1
+            yield line
+
+
+class _FakeSession:
+    def __init__(self, chunks):
+        self.response = _FakeResponse(chunks)
+
+    def post(self, *args, **kwargs):
+        self.payload = kwargs["json"]
+        return self.response
+
+
+def _client(chunks):
+    client = LLMClient(base_url="http://127.0.0.1:9")
+    client._session = _FakeSession(chunks)
+    return client
+
+
+def test_feed_returns_offset_past_closing_brace():
+    json_end = _JsonObjectEnd()
+    assert json_end.feed('{"plan": "a {b}", "act') is None
+    text = 'ions": []}\nHope this helps!'
+    assert text[: json_end.feed(text)] == 'ions": []}'
+
+
+def test_feed_ignores_replies_that_open_with_prose():
+    assert _JsonObjectEnd().feed('Sure! {"plan": "x"}') is None
+
+
+def test_action_reply_is_cut_after_json_in_same_chunk():
+    plan = '{"plan": "List files.", "actions": [{"tool": "list_directory"}]}'
+    client = _client([plan[:20], plan[20:] + "\nHope this helps!", " more"])
+
+    raw = client._post_chat([], stop_after_json=True)
+
+    assert raw == plan
+    assert client._session.response.lines_read == 2
+
+
+def test_chat_reply_is_not_cut():
+    client = _client(['{"a": 1}', " and more"])
+    assert client._post_chat([]) == '{"a": 1} and more'
+
+
+def test_keep_alive_is_only_sent_when_configured(monkeypatch):
+    monkeypatch.delenv("TERMINAL_AGENT_KEEP_ALIVE", raising=False)
+    monkeypatch.delenv("OLLAMA_KEEP_ALIVE", raising=False)
+    client = _client(["hi"])
+    client._post_chat([])
+    assert "keep_alive" not in client._session.payload
+
+    monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "30m")
+    client = _client(["hi"])
+    client._post_chat([])
+    assert client._session.payload["keep_alive"] == "30m"
+
+
+class _StubLLM:
+    def __init__(self, raw):
+        self.raw = raw
+
+    def chat(self, **kwargs):
+        return self.raw
+
+
+def test_plan_followed_by_prose_still_parses():
+    raw = (
+        '{"plan": "List files.", "actions": [{"tool": "list_directory"}]}'
+        "\nHope this helps!"
+    )
+    plan = get_action_plan(_StubLLM(raw), "list files", tools="")
+
+    assert plan is not None
+    assert plan.actions[0].tool == "list_directory"
+
+
+def test_unparseable_reply_gives_no_plan():
+    assert get_action_plan(_StubLLM("I can't help with that."), "q", tools="") is None
+
+
+def test_missing_model_is_reported_without_traceback(monkeypatch, capsys):
+    def warmup(self):
+        self._known_models = frozenset({"other:latest"})
+
+    monkeypatch.setattr(LLMClient, "_warmup", warmup)
+    monkeypatch.setenv("TERMINAL_AGENT_MODEL", "llama3.2")
+    monkeypatch.setattr(sys, "argv", ["terminal-agent", "ask", "--no-cache", "hi"])
+
+    with pytest.raises(SystemExit) as exc:
+        agent_cli.main()
+
+    assert exc.value.code == 1
+    assert "ollama pull llama3.2" in capsys.readouterr().out
@@ -0,0 +1,97 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core import tools
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    for name in ["a.py", "src/b.py", "src/pkg/c.py", "src/notes.txt", "docs/d.py"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("needle\n")
+    # search_content reports paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("**/*.py", ["a.py", "docs/d.py", "src/b.py", "src/pkg/c.py"]),
+        ("src/**/*.py", ["src/b.py", "src/pkg/c.py"]),
+        ("src/*.py", ["src/b.py"]),
+        ("*.txt", ["src/notes.txt"]),
+    ],
+)
+def test_search_file_pattern_matches_like_recursive_glob(tree, pattern, expected):
+    result = tools.search_content("needle", path=str(tree), file_pattern=pattern)
+
+    assert result["ok"], result
+    assert sorted(r["file"] for r in result["results"]) == expected
+    globbed = [p for p in tree.glob("**/" + pattern) if p.is_file()]
+    assert sorted(str(p.relative_to(tree)) for p in globbed) == expected
+
+
+def test_fastcopy_falls_back_when_kernel_copy_reports_nothing(tmp_path, monkeypatch):
+    # procfs/sysfs/FUSE files can make copy_file_range return 0 straight
+    # away; that must not be taken as EOF and leave an empty copy
+    monkeypatch.setattr(tools, "_CAN_REFLINK", False)
+    monkeypatch.setattr(tools.os, "copy_file_range", lambda *a: 0, raising=False)
+    src = tmp_path / "src.txt"
+    src.write_bytes(b"data\n" * 1000)
+    dst = tmp_path / "dst.txt"
+
+    tools._fastcopy(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_summarize_prefers_file_over_exact_directory_match(tmp_path, monkeypatch):
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes.md").write_text("# Notes\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tools.Path, "home", lambda: tmp_path)
+
+    result = tools.summarize_file("notes")
+
+    assert result["ok"], result
+    assert Path(result["file_path"]).name == "notes.md"
+
+
+@pytest.mark.parametrize("myers", [True, False])
+def test_compare_files_reports_missing_final_newline(tmp_path, monkeypatch, myers):
+    if myers and not tools.HAS_DIFF_MATCH_PATCH:
+        pytest.skip("needs diff-match-patch")
+    monkeypatch.setattr(tools, "HAS_DIFF_MATCH_PATCH", myers)
+    (tmp_path / "a.txt").write_bytes(b"a\nb")
+    (tmp_path / "b.txt").write_bytes(b"a\nb\n")
+
+    result = tools.compare_files(str(tmp_path / "a.txt"), str(tmp_path / "b.txt"))
+
+    assert result["ok"] and not result["identical"]
+    assert result["diff"].splitlines()[-3:] == [
+        "-b",
+        "\\ No newline at end of file",
+        "+b",
+    ]
+
+
+def test_compare_files_never_calls_different_bytes_identical(tmp_path):
+    (tmp_path / "unix.txt").write_bytes(b"a\nb\n")
+    (tmp_path / "dos.txt").write_bytes(b"a\r\nb\r\n")
+
+    result = tools.compare_files(str(tmp_path / "unix.txt"), str(tmp_path / "dos.txt"))
+
+    assert result["ok"] and not result["identical"]
+
+
+@pytest.mark.parametrize("command", ["echo -e a", "echo -n done", "printf %s x"])
+def test_builtins_run_in_the_shell(command):
+    expected = subprocess.run(command, shell=True, capture_output=True, text=True)
+
+    result = tools.run_shell(command)
+
+    assert result["stdout"] == expected.stdout